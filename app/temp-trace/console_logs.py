@@ -1,12 +1,19 @@
-import json
 from pathlib import Path
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+_DecodeError = getattr(_json, 'JSONDecodeError', ValueError)
+# Playwright writes compact JSON, so console entries can be spotted before parsing.
+needle=b'"type":"console"'
 path=Path('app/temp-trace/0-trace.trace')
-for line in path.read_text().splitlines():
-    if not line.strip():
-        continue
-    try:
-        entry=json.loads(line)
-    except json.JSONDecodeError:
-        continue
-    if entry.get('type')=='console':
-        print(entry)
+with path.open('rb', buffering=1 << 18) as f:
+    for line in f:
+        if needle not in line:
+            continue
+        try:
+            entry=_json.loads(line)
+        except _DecodeError:
+            continue
+        if entry.get('type')=='console':
+            print(entry)
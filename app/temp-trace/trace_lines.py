@@ -1,6 +1,7 @@
+from itertools import islice
 from pathlib import Path
 path = Path('app/temp-trace/0-trace.trace')
-for i,line in enumerate(path.read_text().splitlines()):
-    print(f"{i:03}: {line}")
-    if i>=50:
-        break
+with path.open('rb', buffering=1 << 18) as f:
+    for i,raw in enumerate(islice(f, 0, 51)):
+        line = raw.decode('utf-8').rstrip('\r\n')
+        print(f"{i:03}: {line}")
@@ -1,5 +1,7 @@
+from itertools import islice
 from pathlib import Path
 path = Path('app/temp-trace/0-trace.trace')
-for i,line in enumerate(path.read_text().splitlines()):
-    if 200 <= i <= 320:
+with path.open('rb', buffering=1 << 16) as f:
+    for i,raw in enumerate(islice(f, 200, 321), start=200):
+        line = raw.decode('utf-8').rstrip('\r\n')
         print(f"{i:03}: {line}")
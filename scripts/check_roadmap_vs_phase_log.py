@@ -7,7 +7,7 @@ from typing import Dict
 
 
 RE_ROADMAP_ROW = re.compile(r"^\| (P\d(?:\.\d)?) \| [^|]+ \| ([^|]+) \|")
-RE_PHASE_ENTRY = re.compile(r"Phase\s+(\d(?:\.\d)?)\s.*\(([^)]+)\)")
+RE_PHASE_ENTRY = re.compile(r"Phase ([0-9](?:\.[0-9])?) [^\n]*\(([^)]+)\)", re.ASCII)
 
 STATUS_MAP: Dict[str, str] = {
     "IN PROGRESS": "In progress",
@@ -22,22 +22,34 @@ PRIORITY = {"In progress": 2, "Complete": 1, "Planned": 0}
 
 def load_roadmap_statuses(path: Path) -> Dict[str, str]:
     statuses: Dict[str, str] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        match = RE_ROADMAP_ROW.match(line.strip())
-        if match:
-            phase, status = match.groups()
-            statuses[phase] = status.strip()
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            # Only table rows for phases can match; skip prose and headers without the regex.
+            if not stripped.startswith("| P"):
+                continue
+            match = RE_ROADMAP_ROW.match(stripped)
+            if match:
+                phase, status = match.groups()
+                statuses[phase] = status.strip()
     return statuses
 
 
 def load_phase_log_statuses(path: Path) -> Dict[str, str]:
     statuses: Dict[str, str] = {}
-    for match in RE_PHASE_ENTRY.finditer(path.read_text(encoding="utf-8")):
-        phase, raw = match.groups()
-        normalized = STATUS_MAP.get(raw.upper(), "Planned")
-        current = statuses.get(f"P{phase}", "Planned")
-        if PRIORITY[normalized] >= PRIORITY.get(current, 0):
-            statuses[f"P{phase}"] = normalized
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if "Phase " not in line:
+                continue
+            match = RE_PHASE_ENTRY.search(line)
+            if match is None:
+                continue
+            phase, raw = match.groups()
+            # Log entries are written in upper case, so try the raw capture before upper().
+            normalized = STATUS_MAP.get(raw) or STATUS_MAP.get(raw.upper(), "Planned")
+            current = statuses.get(f"P{phase}", "Planned")
+            if PRIORITY[normalized] >= PRIORITY.get(current, 0):
+                statuses[f"P{phase}"] = normalized
     return statuses
 
 
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import argparse
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Check a run ledger (load/eval) for SLO violations."
     )
@@ -24,14 +28,23 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def load_ledger(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"ledger not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"ledger not found: {path}") from exc
+    with handle:
+        return json.load(handle)
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = parse_args(argv)
-    ledger = load_ledger(args.ledger)
+    raw = sys.argv[1:] if argv is None else argv
+    if len(raw) == 1 and not raw[0].startswith("-"):
+        # Common CI form: a single ledger path with the default requirement; skip argparse.
+        ledger_path, require = Path(raw[0]), "ok"
+    else:
+        args = parse_args(argv)
+        ledger_path, require = args.ledger, args.require
+    ledger = load_ledger(ledger_path)
 
     result = ledger.get("result")
     if not isinstance(result, dict):
@@ -51,8 +64,8 @@ def main(argv: list[str] | None = None) -> int:
         for entry in violations:
             print(f" - {entry}")
 
-    if status != args.require:
-        print(f"SLO status expected '{args.require}' but was '{status}'.", file=sys.stderr)
+    if status != require:
+        print(f"SLO status expected '{require}' but was '{status}'.", file=sys.stderr)
         return 1
 
     return 0
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-import argparse
 import json
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator
 
+if TYPE_CHECKING:
+    import argparse
 
-@dataclass(frozen=True)
+_DEFAULT_OUTPUT = Path("dependency-report.json")
+_DEFAULT_FILES = [Path("requirements.lock"), Path("requirements.dev.lock")]
+
+
+@dataclass(frozen=True, slots=True)
 class DependencyRecord:
     name: str
     version: str
@@ -19,30 +26,31 @@ class DependencyRecord:
 def parse_requirements(path: Path) -> Iterator[DependencyRecord]:
     if not path.exists():
         return iter(())
-    for line in path.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if "==" in stripped:
-            name, version = stripped.split("==", 1)
-            yield DependencyRecord(name=name.lower(), version=version, source=str(path))
-        else:
-            yield DependencyRecord(name=stripped.lower(), version="*", source=str(path))
+    source = str(path)
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if not stripped or stripped[0] == "#":
+                continue
+            if "==" in stripped:
+                name, version = stripped.split("==", 1)
+                yield DependencyRecord(name=name.lower(), version=version, source=source)
+            else:
+                yield DependencyRecord(name=stripped.lower(), version="*", source=source)
 
 
 def collect_records(paths: Iterable[Path]) -> list[DependencyRecord]:
-    records: list[DependencyRecord] = []
-    seen: set[tuple[str, str]] = set()
+    # A dict dedups on (name, version) and keeps first-seen order in one structure.
+    seen: dict[tuple[str, str], DependencyRecord] = {}
     for path in paths:
         for record in parse_requirements(path):
-            key = (record.name, record.version)
-            if key not in seen:
-                records.append(record)
-                seen.add(key)
-    return records
+            seen.setdefault((record.name, record.version), record)
+    return list(seen.values())
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Summarize dependencies from requirements lockfiles."
     )
@@ -50,28 +58,38 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--output",
         "-o",
         type=Path,
-        default=Path("dependency-report.json"),
+        default=_DEFAULT_OUTPUT,
         help="Path to write the JSON report (default: dependency-report.json)",
     )
     parser.add_argument(
         "files",
         nargs="*",
         type=Path,
-        default=[Path("requirements.lock"), Path("requirements.dev.lock")],
+        default=_DEFAULT_FILES,
         help="Lockfiles or requirement snapshots to inspect.",
     )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = parse_args(argv)
-    records = collect_records(args.files)
+    raw = sys.argv[1:] if argv is None else argv
+    if raw:
+        args = parse_args(argv)
+        output, files = args.output, args.files
+    else:
+        # No arguments means all defaults, so argparse has nothing to do.
+        output, files = _DEFAULT_OUTPUT, _DEFAULT_FILES
+    records = collect_records(files)
     payload = {
-        "dependencies": [asdict(record) for record in sorted(records, key=lambda r: r.name)],
-        "sources": [str(path) for path in args.files],
+        "dependencies": [
+            {"name": record.name, "version": record.version, "source": record.source}
+            for record in sorted(records, key=attrgetter("name"))
+        ],
+        "sources": [str(path) for path in files],
     }
-    args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    print(f"Wrote dependency report with {len(records)} entries to {args.output}")
+    with output.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+    print(f"Wrote dependency report with {len(records)} entries to {output}")
     return 0
 
 
@@ -5,9 +5,12 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Protocol, Sequence
+from typing import Any, Protocol, Sequence, cast
 
 from blackskies.services import runs
 from blackskies.services.eval import EvalTask, EvalTaskFlow, load_dataset
@@ -16,10 +19,14 @@ from blackskies.services.eval.report import (
     EvalCaseResult,
     EvalReport,
     build_report,
-    render_html,
+    render_html_to,
 )
 from blackskies.services.tools.registry import ToolRegistry
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = cast("Any", None)
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -122,6 +129,17 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Fail if P95 latency exceeds this threshold in milliseconds",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of tasks to evaluate concurrently (defaults to the CPU count)",
+    )
+    parser.add_argument(
+        "--short-circuit-on-failure",
+        action="store_true",
+        help="Stop evaluating once the pass-rate threshold can no longer be met",
+    )
     return parser.parse_args(argv)
 
 
@@ -129,6 +147,7 @@ def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=32)
 def _build_registry(project_id: str) -> ToolRegistry:
     metadata = {"project_id": project_id, "tools": {"allow": ["*"], "deny": []}}
     kwargs: dict[str, Any] = {}
@@ -138,6 +157,12 @@ def _build_registry(project_id: str) -> ToolRegistry:
 
 
 def _evaluate_task(task: EvalTask, *, run_id: str) -> EvalCaseResult:
+    # The start, tool-permission and completion events for a task share one ledger write.
+    with runs.batch_events(run_id):
+        return _run_task(task, run_id=run_id)
+
+
+def _run_task(task: EvalTask, *, run_id: str) -> EvalCaseResult:
     project_id = getattr(task.inputs, "project_id", "eval")
     registry = _build_registry(project_id)
     runs.append_event(
@@ -145,7 +170,7 @@ def _evaluate_task(task: EvalTask, *, run_id: str) -> EvalCaseResult:
         "eval.task_start",
         {"task_id": task.task_id, "flow": task.flow.value, "project_id": project_id},
     )
-    start = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     runner = FLOW_RUNNERS.get(task.flow)
     passed = False
     error: str | None = None
@@ -161,7 +186,7 @@ def _evaluate_task(task: EvalTask, *, run_id: str) -> EvalCaseResult:
             error = str(exc)
             passed = False
 
-    latency_ms = (time.perf_counter() - start) * 1000
+    latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     result = EvalCaseResult(
         task_id=task.task_id,
         flow=task.flow,
@@ -185,6 +210,47 @@ def _evaluate_task(task: EvalTask, *, run_id: str) -> EvalCaseResult:
     return result
 
 
+def _evaluate_tasks(
+    tasks: Sequence[EvalTask],
+    *,
+    run_id: str,
+    workers: int,
+    fail_under_pass_rate: float | None = None,
+) -> list[EvalCaseResult]:
+    """Evaluate ``tasks`` in order, optionally stopping once the pass rate is out of reach."""
+
+    evaluate = partial(_evaluate_task, run_id=run_id)
+    total = len(tasks)
+    failed = 0
+
+    def _doomed(result: EvalCaseResult) -> bool:
+        nonlocal failed
+        if fail_under_pass_rate is None or result.passed:
+            return False
+        failed += 1
+        return (total - failed) / total < fail_under_pass_rate
+
+    if workers == 1:
+        results: list[EvalCaseResult] = []
+        for task in tasks:
+            result = evaluate(task)
+            results.append(result)
+            if _doomed(result):
+                break
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        if fail_under_pass_rate is None:
+            return list(executor.map(evaluate, tasks))
+        futures = [executor.submit(evaluate, task) for task in tasks]
+        for future in as_completed(futures):
+            if _doomed(future.result()):
+                for pending in futures:
+                    pending.cancel()
+                break
+    return [future.result() for future in futures if not future.cancelled()]
+
+
 def _evaluate_thresholds(report: EvalReport, args: argparse.Namespace) -> list[str]:
     reasons: list[str] = []
     if report.metrics.pass_rate < args.fail_under_pass_rate:
@@ -229,31 +295,39 @@ def main(argv: Sequence[str] | None = None) -> int:
     run_metadata = runs.start_run("evaluation", {"dataset": str(dataset_dir)})
     run_id = run_metadata["run_id"]
 
-    case_results: list[EvalCaseResult] = []
-    for task in tasks:
-        case_results.append(_evaluate_task(task, run_id=run_id))
+    case_results = _evaluate_tasks(
+        tasks,
+        run_id=run_id,
+        workers=max(1, min(args.workers, len(tasks))),
+        fail_under_pass_rate=args.fail_under_pass_rate if args.short_circuit_on_failure else None,
+    )
 
     report = build_report(case_results)
     regressions = _evaluate_thresholds(report, args)
+    skipped = len(tasks) - len(case_results)
+    if skipped:
+        regressions.append(
+            "Stopped early after the pass-rate threshold became unreachable; "
+            f"{skipped} tasks skipped"
+        )
     error_budget_remaining, error_budget_consumed = _compute_error_budget(
         report.metrics.pass_rate, args.fail_under_pass_rate
     )
     error_budget_threshold = max(0.0, 1.0 - args.fail_under_pass_rate)
 
+    payload = {"report": report.to_dict(), "regressions": regressions}
     _ensure_parent(args.json)
-    args.json.write_text(
-        json.dumps(
-            {
-                "report": report.to_dict(),
-                "regressions": regressions,
-            },
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        args.json.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with args.json.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
 
     _ensure_parent(args.html)
-    args.html.write_text(render_html(report), encoding="utf-8")
+    with args.html.open("w", encoding="utf-8") as handle:
+        render_html_to(handle, report)
 
     status = "failed" if regressions else "completed"
     slo_status = "breached" if regressions else "ok"
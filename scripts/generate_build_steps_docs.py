@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import Dict
 
@@ -42,15 +43,16 @@ SPECIAL_PROFILES: Dict[int, str] = {
     85: 'All',
 }
 
+UI_KEYWORDS = re.compile('ui|renderer|playwright|electron|dock')
+DESKTOP_FILES = re.compile('app/|pnpm')
+
 
 def infer_profiles(summary: str, files: str, step: int) -> str:
     if step in SPECIAL_PROFILES:
         return SPECIAL_PROFILES[step]
     summary_lower = summary.lower()
     files_lower = files.lower()
-    if any(keyword in summary_lower for keyword in ['ui', 'renderer', 'playwright', 'electron', 'dock']):
-        return 'Desktop, Browser'
-    if 'app/' in files_lower or 'pnpm' in files_lower:
+    if UI_KEYWORDS.search(summary_lower) or DESKTOP_FILES.search(files_lower):
         return 'Desktop, Browser'
     if 'docs' in files_lower or 'readme' in summary_lower:
         return 'All'
@@ -59,9 +61,12 @@ def infer_profiles(summary: str, files: str, step: int) -> str:
     return 'API-only'
 
 
+DASH_TABLE = str.maketrans({'—': '-', '–': '-'})
+CHECKLIST_ROW = '| {} | {} | {} | {} | {} |\n'.format
+
+
 def sanitize(text: str) -> str:
-    cleaned = text.replace('', '').replace('—', '-').replace('–', '-')
-    return cleaned.strip()
+    return text.translate(DASH_TABLE).strip()
 
 
 def bullet(text: str) -> str:
@@ -69,69 +74,65 @@ def bullet(text: str) -> str:
 
 
 def display_name(name: str) -> str:
-    return name.replace('—', '-').replace('–', '-')
+    return name.translate(DASH_TABLE)
 
 
 def generate_docs() -> None:
-    data = json.loads(DATA_PATH.read_text(encoding='utf-8'))
-
-    checklist_lines = [
-        '# Build Steps Checklist',
-        '',
-        'Generated from build_steps.json. Profiles indicate which deployment surfaces a step touches.',
-        ''
-    ]
-
-    playbook_lines = [
-        '# Build Steps Playbook',
-        '',
-        'Reference of every step with commands, acceptance notes, and Codex prompts. Generated from build_steps.json.',
-        ''
-    ]
-
-    for milestone in data:
-        raw_name = milestone['milestone']
-        name = display_name(raw_name)
-        mandatory_flag = milestone['mandatory_for_rc'] or raw_name in MANDATORY_MILESTONES
-        mandatory = 'Mandatory for RC' if mandatory_flag else 'Post-RC (optional)'
-
-        checklist_lines.append(f'## {name}')
-        checklist_lines.append(f'*Status:* {mandatory}')
-        checklist_lines.append('')
-        checklist_lines.append('| Step | Summary | Profiles | Artifacts | Command |')
-        checklist_lines.append('| :--- | :------ | :------- | :-------- | :------- |')
-
-        playbook_lines.append(f'## {name}')
-        playbook_lines.append(f'*Status:* {mandatory}')
-        playbook_lines.append('')
-
-        for step in milestone['steps']:
-            step_num = step['step']
-            summary = step['summary']
-            files = sanitize(step.get('files', '-')) or '-'
-            command = sanitize(step.get('command', '-')) or '-'
-            profiles = infer_profiles(summary, files, step_num)
-
-            checklist_lines.append(f'| {step_num} | {summary} | {profiles} | {files} | {command} |')
-
-            playbook_lines.append(f'### Step {step_num}: {summary}')
-            playbook_lines.append(f'- **Profiles:** {profiles}')
-            playbook_lines.append(f'- **Primary artifacts:** {files}')
-            what = bullet(step.get('what', ''))
-            if what:
-                playbook_lines.append(f'- **What:** {what}')
-            playbook_lines.append(f'- **Command:** {command}')
-            acceptance = bullet(step.get('acceptance', 'Ensure command passes and artifacts exist.'))
-            playbook_lines.append(f'- **Acceptance:** {acceptance}')
-            codex = bullet(step.get('codex_ask', ''))
-            if codex:
-                playbook_lines.append(f'- **Codex ask:** {codex}')
-            playbook_lines.append('')
-
-        checklist_lines.append('')
-
-    CHECKLIST_PATH.write_text("\n".join(checklist_lines).rstrip() + "\n", encoding='utf-8')
-    PLAYBOOK_PATH.write_text("\n".join(playbook_lines).rstrip() + "\n", encoding='utf-8')
+    with DATA_PATH.open(encoding='utf-8') as handle:
+        data = json.load(handle)
+
+    with CHECKLIST_PATH.open('w', encoding='utf-8') as checklist, PLAYBOOK_PATH.open(
+        'w', encoding='utf-8'
+    ) as playbook:
+        checklist.write(
+            '# Build Steps Checklist\n\n'
+            'Generated from build_steps.json. '
+            'Profiles indicate which deployment surfaces a step touches.\n'
+        )
+        playbook.write(
+            '# Build Steps Playbook\n\n'
+            'Reference of every step with commands, acceptance notes, and Codex prompts. '
+            'Generated from build_steps.json.\n'
+        )
+
+        for milestone in data:
+            raw_name = milestone['milestone']
+            name = display_name(raw_name)
+            mandatory_flag = milestone['mandatory_for_rc'] or raw_name in MANDATORY_MILESTONES
+            mandatory = 'Mandatory for RC' if mandatory_flag else 'Post-RC (optional)'
+
+            checklist.write(
+                f'\n## {name}\n*Status:* {mandatory}\n\n'
+                '| Step | Summary | Profiles | Artifacts | Command |\n'
+                '| :--- | :------ | :------- | :-------- | :------- |\n'
+            )
+            playbook.write(f'\n## {name}\n*Status:* {mandatory}\n')
+
+            for step in milestone['steps']:
+                step_num = step['step']
+                summary = step['summary']
+                files = sanitize(step.get('files', '-')) or '-'
+                command = sanitize(step.get('command', '-')) or '-'
+                profiles = infer_profiles(summary, files, step_num)
+
+                checklist.write(CHECKLIST_ROW(step_num, summary, profiles, files, command))
+
+                playbook.write(
+                    f'\n### Step {step_num}: {summary}\n'
+                    f'- **Profiles:** {profiles}\n'
+                    f'- **Primary artifacts:** {files}\n'
+                )
+                what = bullet(step.get('what', ''))
+                if what:
+                    playbook.write(f'- **What:** {what}\n')
+                playbook.write(f'- **Command:** {command}\n')
+                acceptance = bullet(
+                    step.get('acceptance', 'Ensure command passes and artifacts exist.')
+                )
+                playbook.write(f'- **Acceptance:** {acceptance}\n')
+                codex = bullet(step.get('codex_ask', ''))
+                if codex:
+                    playbook.write(f'- **Codex ask:** {codex}\n')
 
     OVERVIEW_PATH.write_text(
         """# Build Steps Overview
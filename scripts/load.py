@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import heapq
 import json
 import logging
 import math
@@ -12,11 +13,13 @@ import shlex
 import shutil
 import subprocess
 import sys
+from array import array
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from statistics import mean
 from time import perf_counter
-from typing import Any, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Coroutine, Iterable, Iterator, Mapping, Sequence, TypeVar, cast
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:  # pragma: no cover - path hygiene
@@ -34,16 +37,31 @@ except ModuleNotFoundError as exc:  # pragma: no cover - surfaced during CLI usa
         "PyYAML is required for load testing. Install it with 'pip install pyyaml'."
     ) from exc
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = cast("Any", None)
+
+try:  # pragma: no cover - optional dependency
+    import uvloop  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    uvloop = cast("Any", None)
+
 from blackskies.services import runs
 
 import smoke_runner
 
 LOGGER = logging.getLogger("blackskies.load")
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_CLOADER = getattr(yaml, "CSafeLoader", None)
+
 DEFAULT_PROFILES_PATH = Path("config/load_profiles.yaml")
 DEFAULT_SERVICE_COMMAND = (
     "uvicorn blackskies.services.app:create_app --factory --host {host} --port {port}"
 )
+# Below this many requests a full sort is as cheap as heap selection for one percentile.
+_SELECT_MIN_REQUESTS = 1024
 
 
 @dataclass(slots=True)
@@ -71,41 +89,128 @@ class LoadProfile:
     description: str | None = None
 
 
+@dataclass(slots=True)
+class _PathStats:
+    """Running per-path request count, latency sum and error count."""
+
+    count: int = 0
+    latency_sum_ms: float = 0.0
+    error_count: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSummary:
+    """Aggregate figures for a finished load run, computed once for reporting."""
+
+    total_requests: int
+    error_count: int
+    error_rate: float
+    avg_latency_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    total_budget_usd: float
+    duration_seconds: float | None
+    requests_per_second: float | None
+
+
 @dataclass(slots=True)
 class LoadMetrics(smoke_runner.SmokeMetricsSink):
     """Collect request latency and budget metrics during execution."""
 
-    requests: list[dict[str, Any]] = field(default_factory=list)
     budgets: list[float] = field(default_factory=list)
     started_at: float | None = None
     finished_at: float | None = None
+    # Requests are stored column-wise so long runs do not hold one dict per request;
+    # methods and paths are recorded as small integer codes into ``_labels``.
+    _label_codes: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _labels: list[str] = field(default_factory=list, init=False, repr=False)
+    _method_ids: array[int] = field(default_factory=lambda: array("I"), init=False, repr=False)
+    _path_ids: array[int] = field(default_factory=lambda: array("I"), init=False, repr=False)
+    _statuses: array[int] = field(default_factory=lambda: array("H"), init=False, repr=False)
+    _latencies: array[float] = field(default_factory=lambda: array("d"), init=False, repr=False)
+    _sorted_latencies: list[float] | None = field(default=None, init=False, repr=False)
+    _error_count: int = field(default=0, init=False, repr=False)
+    # Keyed by path code; latencies stay in ``_latencies`` and are only grouped for percentiles.
+    _path_stats: dict[int, _PathStats] = field(default_factory=dict, init=False, repr=False)
+
+    def _label_code(self, label: str) -> int:
+        code = self._label_codes.get(label)
+        if code is None:
+            code = self._label_codes[label] = len(self._labels)
+            self._labels.append(label)
+        return code
 
     def record_request(self, *, method: str, path: str, status: int, elapsed_ms: float) -> None:
-        self.requests.append(
+        path_id = self._label_code(path)
+        self._method_ids.append(self._label_code(method))
+        self._path_ids.append(path_id)
+        self._statuses.append(status)
+        self._latencies.append(elapsed_ms)
+        self._sorted_latencies = None
+        path_stats = self._path_stats.get(path_id)
+        if path_stats is None:
+            path_stats = self._path_stats[path_id] = _PathStats()
+        path_stats.count += 1
+        path_stats.latency_sum_ms += elapsed_ms
+        if status >= 400:
+            self._error_count += 1
+            path_stats.error_count += 1
+
+    @property
+    def requests(self) -> tuple[dict[str, Any], ...]:
+        """Return a read-only snapshot of the recorded requests rebuilt from the columns.
+
+        Use :meth:`record_request` to add requests; appending to the snapshot has no effect.
+        """
+
+        labels = self._labels
+        return tuple(
             {
-                "method": method,
-                "path": path,
+                "method": labels[method_id],
+                "path": labels[path_id],
                 "status": status,
                 "elapsed_ms": elapsed_ms,
             }
+            for method_id, path_id, status, elapsed_ms in zip(
+                self._method_ids, self._path_ids, self._statuses, self._latencies
+            )
         )
 
+    @requests.setter
+    def requests(self, entries: Iterable[Mapping[str, Any]]) -> None:
+        self._label_codes.clear()
+        self._labels.clear()
+        del self._method_ids[:]
+        del self._path_ids[:]
+        del self._statuses[:]
+        del self._latencies[:]
+        self._sorted_latencies = None
+        self._error_count = 0
+        self._path_stats.clear()
+        for entry in entries:
+            self.record_request(
+                method=entry["method"],
+                path=entry["path"],
+                status=entry["status"],
+                elapsed_ms=entry["elapsed_ms"],
+            )
+
     def record_budget(self, *, estimated_cost_usd: float) -> None:
         self.budgets.append(estimated_cost_usd)
 
     @property
     def total_requests(self) -> int:
-        return len(self.requests)
+        return len(self._latencies)
 
     @property
     def error_count(self) -> int:
-        return sum(1 for entry in self.requests if entry["status"] >= 400)
+        return self._error_count
 
     @property
     def error_rate(self) -> float:
-        if not self.requests:
+        if not self._latencies:
             return 0.0
-        return self.error_count / len(self.requests)
+        return self.error_count / len(self._latencies)
 
     @property
     def total_budget(self) -> float:
@@ -136,35 +241,68 @@ class LoadMetrics(smoke_runner.SmokeMetricsSink):
         return self.total_requests / duration
 
     def percentile(self, percentile: float) -> float | None:
-        if not self.requests:
-            return None
-        latencies = sorted(entry["elapsed_ms"] for entry in self.requests)
-        rank = percentile / 100 * (len(latencies) - 1)
-        lower = math.floor(rank)
-        upper = math.ceil(rank)
-        if lower == upper:
-            return latencies[int(rank)]
-        fraction = rank - lower
-        return latencies[lower] + (latencies[upper] - latencies[lower]) * fraction
+        count = len(self._latencies)
+        if self._sorted_latencies is None and count >= _SELECT_MIN_REQUESTS:
+            rank = percentile / 100 * (count - 1)
+            lower = math.floor(rank)
+            upper = math.ceil(rank)
+            # A tail percentile only needs the few values around its rank, which a heap
+            # selection finds without sorting (and caching) the full latency column.
+            if 0 <= lower and upper < count and 8 * min(upper + 1, count - lower) <= count:
+                if upper + 1 <= count - lower:
+                    smallest = heapq.nsmallest(upper + 1, self._latencies)
+                    low, high = smallest[lower], smallest[upper]
+                else:
+                    largest = heapq.nlargest(count - lower, self._latencies)
+                    low, high = largest[-1], largest[count - 1 - upper]
+                return low + (high - low) * (rank - lower) if lower != upper else low
+        return self.percentiles(percentile)[0]
+
+    def percentiles(self, *percentiles: float) -> tuple[float | None, ...]:
+        """Return several latency percentiles, sorting the recorded latencies at most once."""
+
+        if not self._latencies:
+            return (None,) * len(percentiles)
+        latencies = self._sorted_latencies
+        if latencies is None:
+            latencies = self._sorted_latencies = sorted(self._latencies)
+        return tuple(self._percentile_from_sorted(latencies, value) for value in percentiles)
+
+    def compute_summary(self) -> LoadSummary:
+        p95, p99 = self.percentiles(95.0, 99.0)
+        return LoadSummary(
+            total_requests=self.total_requests,
+            error_count=self.error_count,
+            error_rate=self.error_rate,
+            avg_latency_ms=self.average_latency(),
+            p95_ms=p95,
+            p99_ms=p99,
+            total_budget_usd=self.total_budget,
+            duration_seconds=self.duration_seconds,
+            requests_per_second=self.requests_per_second,
+        )
 
     def average_latency(self) -> float | None:
-        if not self.requests:
+        if not self._latencies:
             return None
-        return mean(entry["elapsed_ms"] for entry in self.requests)
+        return mean(self._latencies)
 
     def per_path_summary(self) -> dict[str, Any]:
         summary: dict[str, Any] = {}
-        by_path: dict[str, list[dict[str, Any]]] = {}
-        for entry in self.requests:
-            by_path.setdefault(entry["path"], []).append(entry)
-        for path, entries in by_path.items():
-            latencies = sorted(item["elapsed_ms"] for item in entries)
-            summary[path] = {
-                "count": len(entries),
-                "avg_ms": mean(latencies),
+        # Counts, sums and errors are kept while recording; latencies are grouped by path
+        # code here only because the percentiles need each path's samples.
+        by_path: dict[int, list[float]] = {path_id: [] for path_id in self._path_stats}
+        for path_id, elapsed_ms in zip(self._path_ids, self._latencies):
+            by_path[path_id].append(elapsed_ms)
+        for path_id, path_stats in self._path_stats.items():
+            latencies = by_path[path_id]
+            latencies.sort()
+            summary[self._labels[path_id]] = {
+                "count": path_stats.count,
+                "avg_ms": path_stats.latency_sum_ms / path_stats.count,
                 "p95_ms": self._percentile_from_sorted(latencies, 95.0),
                 "p99_ms": self._percentile_from_sorted(latencies, 99.0),
-                "error_count": sum(1 for item in entries if item["status"] >= 400),
+                "error_count": path_stats.error_count,
             }
         return summary
 
@@ -187,9 +325,20 @@ def configure_logging(level: int) -> None:
 
 
 def load_profile_data(path: Path) -> Mapping[str, Any]:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return _parse_profile_data(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_profile_data(path: Path, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    with path.open(encoding="utf-8") as handle:
+        if _YAML_CLOADER is not None:
+            data = yaml.load(handle, Loader=_YAML_CLOADER)
+        else:
+            data = yaml.safe_load(handle)
     if data is None:
         return {}
     if isinstance(data, Mapping):
@@ -387,11 +536,16 @@ def _maybe_started_service(args: argparse.Namespace) -> Iterator[None]:
             process.wait(timeout=5)
 
 
-def distribute_cycles(total_cycles: int, concurrency: int) -> Iterable[int]:
-    base = total_cycles // concurrency
-    remainder = total_cycles % concurrency
-    for index in range(concurrency):
-        yield base + (1 if index < remainder else 0)
+_T = TypeVar("_T")
+
+
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run ``coro`` to completion, on a uvloop event loop when uvloop is installed."""
+
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
 
 
 async def run_profile(profile: LoadProfile, args: argparse.Namespace, metrics: LoadMetrics) -> None:
@@ -449,45 +603,38 @@ async def run_profile(profile: LoadProfile, args: argparse.Namespace, metrics: L
     if scene_plan is not None:
         scene_plan = scene_plan[warmup_cycles:]
 
-    tasks: list[asyncio.Task[None]] = []
+    config = smoke_runner.SmokeTestConfig(
+        host=args.host,
+        port=args.port,
+        project_id=args.project_id,
+        project_base_dir=project_base_dir,
+        cycles=total_cycles,
+        timeout=profile.timeout,
+        wizard_steps=wizard_steps,
+        scene_ids=tuple(scene_plan) if scene_plan is not None else None,
+    )
+    LOGGER.info(
+        "Running %s cycle(s) with up to %s in flight against %s:%s",
+        total_cycles,
+        profile.concurrency,
+        args.host,
+        args.port,
+    )
     metrics.mark_start()
-    offset = 0
-    for worker_index, cycles in enumerate(distribute_cycles(profile.total_cycles, profile.concurrency)):
-        if cycles <= 0:
-            continue
-        assigned_scene_ids = None
-        if scene_plan is not None:
-            assigned_scene_ids = tuple(scene_plan[offset : offset + cycles])
-            offset += cycles
-        config = smoke_runner.SmokeTestConfig(
-            host=args.host,
-            port=args.port,
-            project_id=args.project_id,
-            project_base_dir=project_base_dir,
-            cycles=cycles,
-            timeout=profile.timeout,
-            wizard_steps=wizard_steps,
-            scene_ids=assigned_scene_ids,
-        )
-        LOGGER.info(
-            "Worker %s running %s cycle(s) against %s:%s",
-            worker_index + 1,
-            cycles,
-            args.host,
-            args.port,
-        )
-        tasks.append(asyncio.create_task(smoke_runner.run_cycles(config, metrics=metrics)))
-
-    await asyncio.gather(*tasks)
+    await smoke_runner.run_cycles(config, metrics=metrics, concurrency=profile.concurrency)
     metrics.mark_end()
 
 
-def evaluate_thresholds(metrics: LoadMetrics, thresholds: Thresholds) -> list[str]:
+def evaluate_thresholds(
+    metrics: LoadMetrics,
+    thresholds: Thresholds,
+    summary: LoadSummary | None = None,
+) -> list[str]:
     reasons: list[str] = []
-    p95 = metrics.percentile(95.0)
-    p99 = metrics.percentile(99.0)
+    summary = summary or metrics.compute_summary()
+    p95, p99 = summary.p95_ms, summary.p99_ms
 
-    if metrics.total_requests == 0:
+    if summary.total_requests == 0:
         reasons.append("No requests were recorded during the load test.")
         return reasons
 
@@ -495,23 +642,23 @@ def evaluate_thresholds(metrics: LoadMetrics, thresholds: Thresholds) -> list[st
         reasons.append(f"P95 latency {p95:.2f}ms exceeds threshold {thresholds.p95_ms:.2f}ms.")
     if p99 is not None and p99 > thresholds.p99_ms:
         reasons.append(f"P99 latency {p99:.2f}ms exceeds threshold {thresholds.p99_ms:.2f}ms.")
-    if metrics.error_rate > thresholds.max_error_rate:
+    if summary.error_rate > thresholds.max_error_rate:
         reasons.append(
             (
                 "Error rate {error_rate:.2%} exceeds threshold {threshold:.2%} "
                 "({errors} errors across {total} requests)."
             ).format(
-                error_rate=metrics.error_rate,
+                error_rate=summary.error_rate,
                 threshold=thresholds.max_error_rate,
-                errors=metrics.error_count,
-                total=metrics.total_requests,
+                errors=summary.error_count,
+                total=summary.total_requests,
             )
         )
-    if metrics.total_budget > thresholds.max_budget_usd:
+    if summary.total_budget_usd > thresholds.max_budget_usd:
         reasons.append(
-            (
-                "Estimated budget spend ${spent:.2f} exceeds threshold ${threshold:.2f}."
-            ).format(spent=metrics.total_budget, threshold=thresholds.max_budget_usd)
+            ("Estimated budget spend ${spent:.2f} exceeds threshold ${threshold:.2f}.").format(
+                spent=summary.total_budget_usd, threshold=thresholds.max_budget_usd
+            )
         )
     return reasons
 
@@ -520,23 +667,23 @@ def build_result_payload(
     metrics: LoadMetrics,
     thresholds: Thresholds,
     breaches: list[str],
+    summary: LoadSummary | None = None,
 ) -> dict[str, Any]:
-    duration = metrics.duration_seconds
-    requests_per_second = metrics.requests_per_second
-    error_budget_remaining = max(thresholds.max_error_rate - metrics.error_rate, 0.0)
-    error_budget_consumed = max(metrics.error_rate - thresholds.max_error_rate, 0.0)
+    summary = summary or metrics.compute_summary()
+    error_budget_remaining = max(thresholds.max_error_rate - summary.error_rate, 0.0)
+    error_budget_consumed = max(summary.error_rate - thresholds.max_error_rate, 0.0)
     slo_status = "breached" if breaches else "ok"
     return {
         "metrics": {
-            "total_requests": metrics.total_requests,
-            "error_count": metrics.error_count,
-            "error_rate": metrics.error_rate,
-            "avg_latency_ms": metrics.average_latency(),
-            "p95_latency_ms": metrics.percentile(95.0),
-            "p99_latency_ms": metrics.percentile(99.0),
-            "total_budget_usd": metrics.total_budget,
-            "duration_seconds": duration,
-            "requests_per_second": requests_per_second,
+            "total_requests": summary.total_requests,
+            "error_count": summary.error_count,
+            "error_rate": summary.error_rate,
+            "avg_latency_ms": summary.avg_latency_ms,
+            "p95_latency_ms": summary.p95_ms,
+            "p99_latency_ms": summary.p99_ms,
+            "total_budget_usd": summary.total_budget_usd,
+            "duration_seconds": summary.duration_seconds,
+            "requests_per_second": summary.requests_per_second,
             "error_budget_remaining": error_budget_remaining,
             "error_budget_consumed": error_budget_consumed,
             "per_path": metrics.per_path_summary(),
@@ -574,6 +721,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     if profile.description:
         LOGGER.info("Profile description: %s", profile.description)
 
+    project_root = smoke_runner.resolve_project_base_dir(args.project_base_dir) / args.project_id
     run_metadata = runs.start_run(
         "load-test",
         {
@@ -592,7 +740,7 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     with _maybe_started_service(args):
         try:
-            asyncio.run(run_profile(profile, args, metrics))
+            _run_async(run_profile(profile, args, metrics))
         except Exception as exc:  # pragma: no cover - CLI surface
             LOGGER.error("Load execution failed: %s", exc)
             runs.finalize_run(
@@ -603,8 +751,9 @@ def main(argv: Sequence[str] | None = None) -> int:
             )
             return 1
 
-    breaches = evaluate_thresholds(metrics, profile.thresholds)
-        result_payload = build_result_payload(metrics, profile.thresholds, breaches)
+    summary = metrics.compute_summary()
+    breaches = evaluate_thresholds(metrics, profile.thresholds, summary)
+    result_payload = build_result_payload(metrics, profile.thresholds, breaches, summary)
     runs.finalize_run(
         run_id,
         status="failed" if breaches else "completed",
@@ -624,23 +773,28 @@ def main(argv: Sequence[str] | None = None) -> int:
             "project_id": args.project_id,
             "result": result_payload,
         }
-        slo_path.write_text(json.dumps(slo_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        if orjson is not None:
+            slo_path.write_bytes(
+                orjson.dumps(slo_payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            slo_path.write_text(
+                json.dumps(slo_payload, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
         LOGGER.info("SLO report written to %s", slo_path)
 
-    duration = metrics.duration_seconds or 0.0
-    rps = metrics.requests_per_second or 0.0
     LOGGER.info(
         (
             "Load metrics: %s requests over %.2fs (%.2f req/s), error rate %.2f%%, "
             "P95 %.2fms, P99 %.2fms, budget $%.2f"
         ),
-        metrics.total_requests,
-        duration,
-        rps,
-        metrics.error_rate * 100,
-        (metrics.percentile(95.0) or 0.0),
-        (metrics.percentile(99.0) or 0.0),
-        metrics.total_budget,
+        summary.total_requests,
+        summary.duration_seconds or 0.0,
+        summary.requests_per_second or 0.0,
+        summary.error_rate * 100,
+        summary.p95_ms or 0.0,
+        summary.p99_ms or 0.0,
+        summary.total_budget_usd,
     )
     LOGGER.info("Run ledger written to %s", ledger_path)
 
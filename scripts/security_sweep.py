@@ -9,7 +9,7 @@ import sys
 from dataclasses import asdict, dataclass
 from importlib import metadata
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Mapping, cast
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -21,6 +21,11 @@ if SERVICES_SRC.exists() and str(SERVICES_SRC) not in sys.path:
 from dependency_report import DependencyRecord, collect_records
 from blackskies.services.config import ServiceSettings
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = cast("Any", None)
+
 
 @dataclass(slots=True)
 class EnvCheckResult:
@@ -162,7 +167,10 @@ def main(argv: list[str] | None = None) -> int:
         "tooling": tool_availability,
     }
 
-    args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        args.output.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     print(f"Security sweep summary written to {args.output}")
     if env_result.missing_keys:
         print("Missing env keys:", ", ".join(env_result.missing_keys))
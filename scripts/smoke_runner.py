@@ -224,8 +224,94 @@ async def _post_json(
     return response
 
 
-async def run_cycles(config: SmokeTestConfig, *, metrics: SmokeMetricsSink | None = None) -> None:
-    """Execute the smoke test cycles using the provided configuration."""
+async def _run_cycle(
+    client: httpx.AsyncClient,
+    config: SmokeTestConfig,
+    *,
+    index: int,
+    scene_id: str,
+    step: str,
+    metrics: SmokeMetricsSink | None,
+) -> None:
+    """Run one wizard-lock, generate, critique and accept cycle for ``scene_id``."""
+
+    project_root = config.project_root
+    label = f"smoke-{index + 1:02d}-{scene_id}"
+    LOGGER.info("[%s] Locking wizard step '%s'", scene_id, step)
+    await _post_json(
+        client,
+        "/api/v1/draft/wizard/lock",
+        {
+            "project_id": config.project_id,
+            "step": step,
+            "label": label,
+        },
+        metrics=metrics,
+    )
+
+    LOGGER.info("[%s] Generating draft", scene_id)
+    generate_payload = {
+        "project_id": config.project_id,
+        "unit_scope": "scene",
+        "unit_ids": [scene_id],
+        "seed": 42 + index,
+        "overrides": {},
+    }
+    generate_response = await _post_json(
+        client, "/api/v1/draft/generate", generate_payload, metrics=metrics
+    )
+    generate_json = generate_response.json()
+    units = generate_json.get("units", [])
+    if not units:
+        raise RuntimeError("Draft generation returned no units.")
+    unit = next((item for item in units if item.get("id") == scene_id), units[0])
+    raw_draft_id = str(generate_json.get("draft_id"))
+    if isinstance(raw_draft_id, str) and re.fullmatch(r"dr_\d{3}", raw_draft_id):
+        draft_id = raw_draft_id
+    else:
+        draft_id = f"dr_{index + 1:03d}"
+        LOGGER.debug("Normalising draft id '%s' to '%s' for load run.", raw_draft_id, draft_id)
+    estimated_cost = (
+        float(generate_json.get("budget", {}).get("estimated_usd", 0.0))
+        if isinstance(generate_json.get("budget"), dict)
+        else 0.0
+    )
+    if metrics is not None:
+        metrics.record_budget(estimated_cost_usd=estimated_cost)
+
+    LOGGER.info("[%s] Requesting critique", scene_id)
+    critique_payload = {
+        "draft_id": draft_id,
+        "unit_id": scene_id,
+        "rubric": ["Logic", "Continuity", "Character"],
+    }
+    await _post_json(client, "/api/v1/draft/critique", critique_payload, metrics=metrics)
+
+    previous_sha = compute_scene_sha(project_root, scene_id)
+    accept_payload = build_accept_payload(
+        project_id=config.project_id,
+        draft_id=draft_id,
+        unit=unit,
+        previous_sha=previous_sha,
+        message=f"Smoke accept cycle {index + 1}",
+        estimated_cost=estimated_cost,
+    )
+
+    LOGGER.info("[%s] Accepting draft", scene_id)
+    await _post_json(client, "/api/v1/draft/accept", accept_payload, metrics=metrics)
+
+
+async def run_cycles(
+    config: SmokeTestConfig,
+    *,
+    metrics: SmokeMetricsSink | None = None,
+    concurrency: int = 1,
+) -> None:
+    """Execute the smoke test cycles using the provided configuration.
+
+    With ``concurrency`` above one, cycles share a single client and up to that many run at
+    once; a new cycle starts as soon as any in-flight cycle finishes.
+    """
 
     project_root = config.project_root
     if not project_root.exists():
@@ -245,75 +331,37 @@ async def run_cycles(config: SmokeTestConfig, *, metrics: SmokeMetricsSink | Non
     ) as client:
         await wait_for_service(config.base_url, config.timeout)
 
-        for index, scene_id in enumerate(scene_ids):
-            step = wizard_steps[index % len(wizard_steps)]
-            label = f"smoke-{index + 1:02d}-{scene_id}"
-            LOGGER.info("[%s] Locking wizard step '%s'", scene_id, step)
-            await _post_json(
-                client,
-                "/api/v1/draft/wizard/lock",
-                {
-                    "project_id": config.project_id,
-                    "step": step,
-                    "label": label,
-                },
-                metrics=metrics,
-            )
-
-            LOGGER.info("[%s] Generating draft", scene_id)
-            generate_payload = {
-                "project_id": config.project_id,
-                "unit_scope": "scene",
-                "unit_ids": [scene_id],
-                "seed": 42 + index,
-                "overrides": {},
-            }
-            generate_response = await _post_json(
-                client, "/api/v1/draft/generate", generate_payload, metrics=metrics
-            )
-            generate_json = generate_response.json()
-            units = generate_json.get("units", [])
-            if not units:
-                raise RuntimeError("Draft generation returned no units.")
-            unit = next((item for item in units if item.get("id") == scene_id), units[0])
-            raw_draft_id = str(generate_json.get("draft_id"))
-            if isinstance(raw_draft_id, str) and re.fullmatch(r"dr_\d{3}", raw_draft_id):
-                draft_id = raw_draft_id
-            else:
-                draft_id = f"dr_{index + 1:03d}"
-                LOGGER.debug(
-                    "Normalising draft id '%s' to '%s' for load run.", raw_draft_id, draft_id
+        if concurrency <= 1:
+            for index, scene_id in enumerate(scene_ids):
+                step = wizard_steps[index % len(wizard_steps)]
+                await _run_cycle(
+                    client, config, index=index, scene_id=scene_id, step=step, metrics=metrics
                 )
-            estimated_cost = (
-                float(generate_json.get("budget", {}).get("estimated_usd", 0.0))
-                if isinstance(generate_json.get("budget"), dict)
-                else 0.0
-            )
-            if metrics is not None:
-                metrics.record_budget(estimated_cost_usd=estimated_cost)
-
-            LOGGER.info("[%s] Requesting critique", scene_id)
-            critique_payload = {
-                "draft_id": draft_id,
-                "unit_id": scene_id,
-                "rubric": ["Logic", "Continuity", "Character"],
-            }
-            await _post_json(
-                client, "/api/v1/draft/critique", critique_payload, metrics=metrics
-            )
-
-            previous_sha = compute_scene_sha(project_root, scene_id)
-            accept_payload = build_accept_payload(
-                project_id=config.project_id,
-                draft_id=draft_id,
-                unit=unit,
-                previous_sha=previous_sha,
-                message=f"Smoke accept cycle {index + 1}",
-                estimated_cost=estimated_cost,
-            )
-
-            LOGGER.info("[%s] Accepting draft", scene_id)
-            await _post_json(client, "/api/v1/draft/accept", accept_payload, metrics=metrics)
+        else:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _bounded_cycle(index: int, scene_id: str) -> None:
+                async with semaphore:
+                    await _run_cycle(
+                        client,
+                        config,
+                        index=index,
+                        scene_id=scene_id,
+                        step=wizard_steps[index % len(wizard_steps)],
+                        metrics=metrics,
+                    )
+
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for index, scene_id in enumerate(scene_ids):
+                        group.create_task(_bounded_cycle(index, scene_id))
+            except ExceptionGroup as errors:
+                # Surface the first failing cycle, as a sequential run would, after logging
+                # any other cycles that failed alongside it.
+                first, *others = errors.exceptions
+                for error in others:
+                    LOGGER.error("Smoke cycle failed: %s", error, exc_info=error)
+                raise first
 
     LOGGER.info("Completed %s smoke cycle(s).", config.cycles)
 
@@ -30,6 +30,11 @@ class ExponentialBackoff:
         bounded = max(self.min_interval, delay)
         return min(self.max_interval, bounded)
 
+    def schedule(self, max_attempts: int) -> tuple[float, ...]:
+        """Return the non-negative delays slept after each failed attempt but the last."""
+
+        return tuple(max(0.0, self.compute(attempt)) for attempt in range(1, max_attempts))
+
 
 class BaseAgent(abc.ABC):
     """Abstract agent with retry/backoff support."""
@@ -46,6 +51,7 @@ class BaseAgent(abc.ABC):
         self._max_attempts = max_attempts
         self._backoff = backoff or ExponentialBackoff()
         self._sleep = sleep or time.sleep
+        self._delays = self._backoff.schedule(max_attempts)
 
     @abc.abstractmethod
     def run_once(self, payload: dict[str, Any]) -> dict[str, Any]:
@@ -54,10 +60,11 @@ class BaseAgent(abc.ABC):
     def run(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Execute with retries and exponential backoff."""
 
-        logger.info(
-            "agent.run",
-            extra={"extra_payload": {"agent": self.__class__.__name__, "payload": payload}},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "agent.run",
+                extra={"extra_payload": {"agent": self.__class__.__name__, "payload": payload}},
+            )
 
         try:
             result = self._execute_with_retries(payload)
@@ -66,10 +73,11 @@ class BaseAgent(abc.ABC):
         except Exception as exc:  # pragma: no cover - unexpected failure surface
             raise AgentError("Agent execution failed unexpectedly.") from exc
 
-        logger.info(
-            "agent.success",
-            extra={"extra_payload": {"agent": self.__class__.__name__}},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "agent.success",
+                extra={"extra_payload": {"agent": self.__class__.__name__}},
+            )
         return result
 
     # Internal helpers --------------------------------------------------
@@ -93,11 +101,13 @@ class BaseAgent(abc.ABC):
         return range(1, self._max_attempts + 1)
 
     def _backoff_sleep(self, attempt: int) -> None:
-        delay = max(0.0, self._backoff.compute(attempt))
+        delay = self._delays[attempt - 1]
         if delay:
             self._sleep(delay)
 
     def _log_retry(self, attempt: int, error: BaseException) -> None:
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         logger.warning(
             "agent.retry",
             extra={
@@ -9,7 +9,7 @@ from typing import Awaitable, Callable, Final
 from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
@@ -48,6 +48,25 @@ LOGGER = logging.getLogger(__name__)
 
 SERVICE_VERSION: Final[str] = "1.0.0-rc1"
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    _DEFAULT_RESPONSE_CLASS: type[JSONResponse] = JSONResponse
+else:
+    _DEFAULT_RESPONSE_CLASS = ORJSONResponse
+
+
+_TRACE_ID_HEADER_BYTES = TRACE_ID_HEADER.encode("latin-1")
+
+
+def _trace_header(scope: Scope) -> str | None:
+    """Return the inbound trace header from the raw (lower-cased) ASGI headers."""
+
+    for name, value in scope.get("headers", ()):
+        if name == _TRACE_ID_HEADER_BYTES:
+            return value.decode("latin-1")
+    return None
+
 
 class TraceMiddleware:
     """ASGI middleware that applies trace IDs and unified error handling."""
@@ -61,8 +80,7 @@ class TraceMiddleware:
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope, receive)
-        trace_id = resolve_trace_id(request.headers.get(TRACE_ID_HEADER))
+        trace_id = resolve_trace_id(_trace_header(scope))
         token = self._trace_context.set(trace_id)
         scope.setdefault("state", {})
         scope["state"]["trace_id"] = trace_id  # type: ignore[index]
@@ -101,6 +119,7 @@ class TraceMiddleware:
             status_holder["status"] = exc.status_code
             diagnostics = getattr(scope["app"].state, "diagnostics", None)
             if diagnostics and exc.project_root is not None:
+                request = Request(scope, receive)
                 audit_details = dict(exc.details)
                 audit_details.setdefault("method", request.method)
                 audit_details.setdefault("path", str(request.url.path))
@@ -115,8 +134,8 @@ class TraceMiddleware:
         except Exception as exc:  # pragma: no cover - defensive guard
             LOGGER.exception(
                 "Unhandled error processing %s %s",
-                request.method,
-                request.url.path,
+                scope["method"],
+                scope["path"],
                 exc_info=exc,
             )
             response = internal_error_response(trace_id)
@@ -125,7 +144,8 @@ class TraceMiddleware:
         finally:
             self._trace_context.reset(token)
             status_code = status_holder["status"] or status.HTTP_500_INTERNAL_SERVER_ERROR
-            record_request(request.method, status_code)
+            record_request(scope["method"], status_code)
+
 
 def create_app(settings: ServiceSettings | None = None) -> FastAPI:
     """Construct the FastAPI application."""
@@ -136,6 +156,7 @@ def create_app(settings: ServiceSettings | None = None) -> FastAPI:
         title="Black Skies Services",
         version=SERVICE_VERSION,
         responses=default_error_responses(),
+        default_response_class=_DEFAULT_RESPONSE_CLASS,
     )
     application.state.settings = service_settings
     application.state.build_tracker = BuildTracker()
@@ -5,9 +5,10 @@ from __future__ import annotations
 import copy
 import json
 import logging
+from dataclasses import dataclass
 from importlib import resources
 from pathlib import Path
-from typing import Any, Final, Iterable, Literal
+from typing import Any, Final, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
@@ -30,7 +31,22 @@ CATEGORIES: Final[list[str]] = [
     "Horror",
 ]
 BLOCKED_RUBRIC_CATEGORIES: Final[set[str]] = {"unknown"}
+_BASE_PRIORITIES: Final[tuple[str, ...]] = (
+    "Validate logical continuity between beats.",
+    "Ensure character motivation remains visible in each reversal.",
+)
 LOGGER = logging.getLogger(__name__)
+# Characters ``str.splitlines`` treats as line boundaries.
+_LINE_BREAKS: Final[str] = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+# Keyed on (pacing or length is severe, pacing and length are both comfortable). The
+# severe flag wins when both are set.
+_SEVERITY_TABLE: Final[dict[tuple[bool, bool], str]] = {
+    (False, False): "medium",
+    (False, True): "low",
+    (True, False): "high",
+    (True, True): "high",
+}
 
 
 class _AdapterLineComment(BaseModel):
@@ -69,32 +85,65 @@ class _AdapterCritiquePayload(BaseModel):
     severity: Literal["low", "medium", "high"]
 
 
-def _sentence_lengths(text: str) -> list[int]:
-    """Return word counts for each sentence in the provided text."""
+@dataclass(slots=True)
+class _TextStats:
+    """Line, word, and sentence statistics gathered in one pass over a draft."""
+
+    line_count: int
+    word_count: int
+    sentence_lengths: list[int]
+    longest_line_index: int
+    longest_line_offset: int
+    longest_line: str
 
-    sentences = [segment.strip() for segment in text.replace("\n", " ").split(".")]
-    lengths: list[int] = []
-    for sentence in sentences:
-        if sentence:
-            lengths.append(len(sentence.split()))
-    return lengths or [0]
 
+def _scan_text(text: str) -> _TextStats:
+    """Collect rubric statistics for ``text`` in a single walk over its lines.
 
-def _longest_line(lines: Iterable[str]) -> tuple[int, str]:
-    """Return the longest line and its one-based index."""
+    Words never span line breaks, so word counts and '.'-delimited sentence lengths
+    are accumulated per line, carrying the open sentence across line boundaries. The
+    longest line's character offset is recorded during the walk so callers do not need
+    to search the text for it again.
+    """
 
+    line_count = 0
+    word_count = 0
+    sentence_lengths: list[int] = []
+    sentence_words = 0
     best_line = ""
     best_index = 0
-    for index, line in enumerate(lines, start=1):
+    best_offset = 0
+    offset = 0
+    for line_count, raw_line in enumerate(text.splitlines(keepends=True), start=1):
+        line = raw_line.rstrip(_LINE_BREAKS)
         if len(line) > len(best_line):
             best_line = line
-            best_index = index
-    return best_index, best_line
+            best_index = line_count
+            best_offset = offset
+        offset += len(raw_line)
+        word_count += len(line.split())
+        segments = line.split(".")
+        sentence_words += len(segments[0].split())
+        for segment in segments[1:]:
+            if sentence_words:
+                sentence_lengths.append(sentence_words)
+            sentence_words = len(segment.split())
+    if sentence_words:
+        sentence_lengths.append(sentence_words)
+    return _TextStats(
+        line_count=line_count,
+        word_count=word_count,
+        sentence_lengths=sentence_lengths or [0],
+        longest_line_index=best_index,
+        longest_line_offset=best_offset,
+        longest_line=best_line,
+    )
 
 
-def _compute_heuristics(draft: Draft) -> dict[str, float]:
+def _compute_heuristics(draft: Draft, *, word_count: int | None = None) -> dict[str, float]:
     metadata = draft.metadata or {}
-    word_count = len(draft.text.split())
+    if word_count is None:
+        word_count = len(draft.text.split())
     heuristics: dict[str, float] = {
         "pov_consistency": 1.0 if metadata.get("pov") else 0.0,
         "goal_clarity": 0.0,
@@ -121,15 +170,15 @@ def apply_rubric(draft: Draft, *, model: dict[str, str] | None = None) -> Critiq
     """Evaluate a draft against the baseline rubric and produce a critique."""
 
     text = draft.text
-    lines = text.splitlines()
-    word_count = len(text.split())
-    sentence_lengths = _sentence_lengths(text)
+    stats = _scan_text(text)
+    word_count = stats.word_count
+    sentence_lengths = stats.sentence_lengths
     avg_sentence = sum(sentence_lengths) / len(sentence_lengths)
     longest_sentence = max(sentence_lengths)
-    line_index, longest_line = _longest_line(lines or [text])
+    line_index, longest_line = stats.longest_line_index, stats.longest_line
 
     summary_parts = [
-        f"Draft '{draft.title}' spans {word_count} words across {len(lines) or 1} line(s).",
+        f"Draft '{draft.title}' spans {word_count} words across {stats.line_count or 1} line(s).",
         (
             "Average sentence length is "
             f"{avg_sentence:.1f} words; longest sentence uses {longest_sentence} words."
@@ -150,10 +199,7 @@ def apply_rubric(draft: Draft, *, model: dict[str, str] | None = None) -> Critiq
             }
         )
 
-    priorities = [
-        "Validate logical continuity between beats.",
-        "Ensure character motivation remains visible in each reversal.",
-    ]
+    priorities = list(_BASE_PRIORITIES)
     if avg_sentence > 20:
         priorities.append("Split or tighten long sentences to restore pacing.")
     if word_count < 200:
@@ -161,22 +207,19 @@ def apply_rubric(draft: Draft, *, model: dict[str, str] | None = None) -> Critiq
 
     suggested_edits: list[dict[str, Any]] = []
     if longest_line:
-        begin = text.find(longest_line)
-        if begin >= 0:
-            suggested_edits.append(
-                {
-                    "range": [begin, begin + len(longest_line)],
-                    "replacement": longest_line.strip().rstrip(",.;") + ".",
-                }
-            )
+        begin = stats.longest_line_offset
+        suggested_edits.append(
+            {
+                "range": [begin, begin + len(longest_line)],
+                "replacement": longest_line.strip().rstrip(",.;") + ".",
+            }
+        )
 
-    severity = "medium"
-    if avg_sentence > 30 or word_count < 120:
-        severity = "high"
-    elif avg_sentence < 12 and word_count > 800:
-        severity = "low"
+    severity = _SEVERITY_TABLE[
+        (avg_sentence > 30 or word_count < 120, avg_sentence < 12 and word_count > 800)
+    ]
 
-    heuristics = _compute_heuristics(draft)
+    heuristics = _compute_heuristics(draft, word_count=word_count)
     critique = Critique(
         unit_id=draft.unit_id,
         summary=" ".join(summary_parts),
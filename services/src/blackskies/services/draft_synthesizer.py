@@ -28,6 +28,16 @@ class DraftSynthesizer:
     """Deterministically synthesize draft units from outline metadata."""
 
     _MODEL = {"name": "draft-synthesizer-v1", "provider": "black-skies-local"}
+    _RESPONSE_META_KEYS = (
+        "pov",
+        "purpose",
+        "emotion_tag",
+        "word_target",
+        "conflict",
+        "conflict_type",
+        "pacing_target",
+    )
+    _SLUG_RE = re.compile(r"[^a-z0-9]+")
 
     def __init__(
         self,
@@ -62,9 +72,7 @@ class DraftSynthesizer:
         )
 
         response_meta = {
-            key: meta[key]
-            for key in ("pov", "purpose", "emotion_tag", "word_target", "conflict", "conflict_type", "pacing_target")
-            if meta.get(key) is not None
+            key: value for key in self._RESPONSE_META_KEYS if (value := meta.get(key)) is not None
         }
         response_meta["order"] = meta["order"]
         response_meta["chapter_id"] = scene.chapter_id
@@ -214,7 +222,7 @@ class DraftSynthesizer:
 
     @staticmethod
     def _slugify(value: str) -> str:
-        slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+        slug = DraftSynthesizer._SLUG_RE.sub("-", value.lower()).strip("-")
         return slug or "scene"
 
     @staticmethod
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Final, Iterator, Literal
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
 
 
 class EvalTaskSchemaVersion(StrEnum):
@@ -134,19 +145,17 @@ class CritiqueSuggestedEdit(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    range: tuple[int, int]
+    range: tuple[NonNegativeInt, NonNegativeInt]
     replacement: str
 
-    @model_validator(mode="after")
-    def validate_range(self) -> "CritiqueSuggestedEdit":
-        start, end = self.range
-        if start < 0 or end < 0:
-            msg = "Suggested edit range positions must be non-negative"
-            raise ValueError(msg)
+    @field_validator("range")
+    @classmethod
+    def validate_range(cls, value: tuple[int, int]) -> tuple[int, int]:
+        start, end = value
         if end < start:
             msg = "Suggested edit range end must be greater than or equal to start"
             raise ValueError(msg)
-        return self
+        return value
 
 
 class CritiqueArtifact(BaseModel):
@@ -249,14 +258,39 @@ _EvalTaskAdapter: Final[TypeAdapter[EvalTask]] = TypeAdapter(
     Annotated[EvalTask, Field(discriminator="flow")]
 )
 
+# Prefer libyaml's C loader when PyYAML was built with it; the bundled offline shim
+# only exposes ``safe_load``.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+_YAML_LOAD = getattr(yaml, "load", None)
+
+
+def _parse_yaml(document: bytes) -> object:
+    if _YAML_LOADER is None or _YAML_LOAD is None:
+        return yaml.safe_load(document)
+    return _YAML_LOAD(document, Loader=_YAML_LOADER)  # noqa: S506 - safe loader
+
+
 DEFAULT_DATASET_DIR = Path(__file__).resolve().parents[2] / "data" / "eval_tasks"
 
 
 def load_task(path: Path) -> EvalTask:
-    """Load and validate a single eval task card."""
+    """Load and validate a single eval task card.
+
+    Parsed cards are memoised on ``(path, mtime_ns, size)`` so repeated dataset loads
+    skip YAML parsing and validation for unchanged files. Cached tasks are shared
+    between callers and must be treated as read-only.
+    """
+
+    stat = path.stat()
+    return _load_task_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
+
+@lru_cache(maxsize=1024)
+def _load_task_cached(path_str: str, mtime_ns: int, size: int) -> EvalTask:
+    del mtime_ns, size  # cache key only
+    path = Path(path_str)
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = _parse_yaml(path.read_bytes())
     except FileNotFoundError:
         raise
     except Exception as exc:  # pragma: no cover - pyyaml specific
@@ -276,10 +310,15 @@ def load_task(path: Path) -> EvalTask:
 
 
 def _iter_task_files(root: Path) -> Iterator[Path]:
-    for pattern in ("*.yaml", "*.yml"):
-        for path in sorted(root.glob(pattern)):
-            if path.is_file():
-                yield path
+    # ``DirEntry.is_file`` reuses the type information returned by the directory read,
+    # avoiding a stat per candidate. ``.yaml`` cards sort ahead of ``.yml`` cards.
+    with os.scandir(root) as entries:
+        cards = [
+            entry for entry in entries if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+        ]
+    cards.sort(key=lambda entry: (entry.name.endswith(".yml"), entry.name))
+    for entry in cards:
+        yield Path(entry.path)
 
 
 def load_dataset(root: Path | None = None) -> list[EvalTask]:
@@ -290,17 +329,21 @@ def load_dataset(root: Path | None = None) -> list[EvalTask]:
         msg = f"Eval task directory does not exist: {base}"
         raise FileNotFoundError(msg)
 
+    paths = list(_iter_task_files(base))
     tasks: list[EvalTask] = []
     seen: dict[str, Path] = {}
 
-    for path in _iter_task_files(base):
-        task = load_task(path)
-        if task.task_id in seen:
-            other = seen[task.task_id]
-            msg = f"Duplicate eval task id '{task.task_id}' detected in {path} and {other}"
-            raise ValueError(msg)
-        seen[task.task_id] = path
-        tasks.append(task)
+    # Cards are read and validated concurrently; results are consumed in sorted path
+    # order so load errors and duplicate detection surface exactly as a serial pass would.
+    workers = min(len(paths), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for path, task in zip(paths, executor.map(load_task, paths)):
+            if task.task_id in seen:
+                other = seen[task.task_id]
+                msg = f"Duplicate eval task id '{task.task_id}' detected in {path} and {other}"
+                raise ValueError(msg)
+            seen[task.task_id] = path
+            tasks.append(task)
 
     return tasks
 
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from statistics import mean
-from typing import Iterable, Sequence
+from math import fsum
+from io import StringIO
+from typing import Iterable, Sequence, TextIO
 
 from .dataset import EvalTaskFlow
 
@@ -73,10 +74,11 @@ class EvalReport:
         }
 
 
-def _compute_percentile(values: Sequence[float], percentile: float) -> float:
-    if not values:
+def _compute_percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    """Return the nearest-rank percentile of an already sorted sequence."""
+
+    if not sorted_values:
         return 0.0
-    sorted_values = sorted(values)
     percentile = max(0.0, min(1.0, percentile))
     index = int(round(percentile * (len(sorted_values) - 1)))
     return sorted_values[index]
@@ -87,10 +89,15 @@ def build_report(results: Iterable[EvalCaseResult]) -> EvalReport:
 
     materialized: list[EvalCaseResult] = list(results)
     total = len(materialized)
-    passed = sum(1 for result in materialized if result.passed)
+    passed = 0
+    latencies: list[float] = []
+    for result in materialized:
+        passed += result.passed
+        latencies.append(result.latency_ms)
     failed = total - passed
-    latencies = [result.latency_ms for result in materialized]
-    avg_latency = mean(latencies) if latencies else 0.0
+    # One sort feeds both percentiles; fsum avoids statistics.mean's Fraction arithmetic.
+    latencies.sort()
+    avg_latency = fsum(latencies) / total if total else 0.0
     p95_latency = _compute_percentile(latencies, 0.95)
     p99_latency = _compute_percentile(latencies, 0.99)
     pass_rate = (passed / total) if total else 0.0
@@ -108,20 +115,11 @@ def build_report(results: Iterable[EvalCaseResult]) -> EvalReport:
     return EvalReport(generated_at=generated_at, metrics=metrics, results=materialized)
 
 
-def render_html(report: EvalReport) -> str:
-    """Render a simple HTML document summarizing the evaluation."""
+def render_html_to(handle: TextIO, report: EvalReport) -> None:
+    """Write the HTML summary for ``report`` to ``handle`` one case row at a time."""
 
-    rows = []
-    for result in report.results:
-        status = "✅" if result.passed else "❌"
-        error = result.error or ""
-        rows.append(
-            f"<tr><td>{result.task_id}</td><td>{result.flow.value}</td>"
-            f"<td>{status}</td><td>{result.latency_ms:.2f}</td><td>{error}</td></tr>"
-        )
-
-    html = f"""
-<!DOCTYPE html>
+    metrics = report.metrics
+    handle.write(f"""<!DOCTYPE html>
 <html lang=\"en\">
   <head>
     <meta charset=\"utf-8\" />
@@ -139,13 +137,13 @@ def render_html(report: EvalReport) -> str:
     <section>
       <h2>Summary</h2>
       <ul>
-        <li>Total tasks: {report.metrics.total}</li>
-        <li>Passed: {report.metrics.passed}</li>
-        <li>Failed: {report.metrics.failed}</li>
-        <li>Pass rate: {report.metrics.pass_rate:.2%}</li>
-        <li>Average latency (ms): {report.metrics.avg_latency_ms:.2f}</li>
-        <li>P95 latency (ms): {report.metrics.p95_latency_ms:.2f}</li>
-        <li>P99 latency (ms): {report.metrics.p99_latency_ms:.2f}</li>
+        <li>Total tasks: {metrics.total}</li>
+        <li>Passed: {metrics.passed}</li>
+        <li>Failed: {metrics.failed}</li>
+        <li>Pass rate: {metrics.pass_rate:.2%}</li>
+        <li>Average latency (ms): {metrics.avg_latency_ms:.2f}</li>
+        <li>P95 latency (ms): {metrics.p95_latency_ms:.2f}</li>
+        <li>P99 latency (ms): {metrics.p99_latency_ms:.2f}</li>
       </ul>
     </section>
     <section>
@@ -161,14 +159,35 @@ def render_html(report: EvalReport) -> str:
           </tr>
         </thead>
         <tbody>
-          {''.join(rows)}
+          """)
+    write = handle.write
+    for result in report.results:
+        status = "✅" if result.passed else "❌"
+        write(
+            f"<tr><td>{result.task_id}</td><td>{result.flow.value}</td>"
+            f"<td>{status}</td><td>{result.latency_ms:.2f}</td><td>{result.error or ''}</td></tr>"
+        )
+    handle.write("""
         </tbody>
       </table>
     </section>
   </body>
-</html>
-"""
-    return html.strip()
+</html>""")
+
+
+def render_html(report: EvalReport) -> str:
+    """Render a simple HTML document summarizing the evaluation."""
+
+    buffer = StringIO()
+    render_html_to(buffer, report)
+    return buffer.getvalue()
 
 
-__all__ = ["EvalCaseResult", "EvalMetrics", "EvalReport", "build_report", "render_html"]
+__all__ = [
+    "EvalCaseResult",
+    "EvalMetrics",
+    "EvalReport",
+    "build_report",
+    "render_html",
+    "render_html_to",
+]
@@ -5,18 +5,41 @@ from __future__ import annotations
 import json
 import logging
 import logging.config
-from datetime import datetime, timezone
-from typing import Any, Dict
+import time
+from typing import Any, Dict, cast
 
 from .tools.safety import postflight_scrub
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = cast("Any", None)
+
 
 class JsonFormatter(logging.Formatter):
-    """Simple JSON formatter for structured logs."""
+    """Simple JSON formatter for structured logs.
+
+    Uses orjson when installed and falls back to the standard library otherwise.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Return ``created`` as an ISO-8601 UTC string, reusing the per-second prefix."""
+
+        seconds = int(created)
+        cached_seconds, prefix = self._second_cache
+        if seconds != cached_seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._second_cache = (seconds, prefix)
+        micros = min(round((created - seconds) * 1_000_000), 999_999)
+        return f"{prefix}.{micros:06d}+00:00"
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
         payload: Dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -26,6 +49,8 @@ class JsonFormatter(logging.Formatter):
         extra = getattr(record, "extra_payload", None)
         if isinstance(extra, dict):
             payload.update(postflight_scrub(extra))
+        if orjson is not None:
+            return cast(str, orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
         return json.dumps(payload, ensure_ascii=False)
 
 
@@ -3,32 +3,54 @@
 from __future__ import annotations
 
 from collections import Counter
+from functools import lru_cache
 from threading import Lock
 from typing import Iterable
 
 _COUNTERS: Counter[str] = Counter()
 _LOCK = Lock()
+# Bumped on every counter change so ``render`` can reuse its last output.
+_GENERATION = 0
+_RENDER_CACHE: tuple[int, str, str] | None = None
+
+
+@lru_cache(maxsize=256)
+def _request_sample(method: str, status_code: int) -> str:
+    """Return the labelled sample name for a method/status pair."""
+
+    labels = f'method="{method.lower()}",status="{status_code}"'
+    return f"blackskies_requests_total{{{labels}}}"
 
 
 def record_request(method: str, status_code: int) -> None:
     """Track an HTTP request labelled by method and status code."""
 
-    labels = f'method="{method.lower()}",status="{status_code}"'
-    sample = f"blackskies_requests_total{{{labels}}}"
+    global _GENERATION
+    sample = _request_sample(method, status_code)
     with _LOCK:
         _COUNTERS[sample] += 1
+        _GENERATION += 1
 
 
-def _snapshot() -> Iterable[tuple[str, int]]:
-    """Yield a snapshot of recorded counters in sorted order."""
+def _snapshot() -> tuple[int, Iterable[tuple[str, int]]]:
+    """Return the counter generation and a sorted snapshot of recorded counters."""
 
     with _LOCK:
-        return sorted(_COUNTERS.items())
+        return _GENERATION, sorted(_COUNTERS.items())
 
 
 def render(service_version: str) -> str:
-    """Render metrics using the Prometheus text exposition format."""
+    """Render metrics using the Prometheus text exposition format.
+
+    The rendered text is reused until a counter changes or the version differs.
+    """
+
+    global _RENDER_CACHE
+    cached = _RENDER_CACHE
+    if cached is not None and cached[0] == _GENERATION and cached[1] == service_version:
+        return cached[2]
 
+    generation, samples = _snapshot()
     lines = [
         (
             "# HELP blackskies_requests_total "
@@ -37,7 +59,7 @@ def render(service_version: str) -> str:
         "# TYPE blackskies_requests_total counter",
     ]
 
-    for sample, value in _snapshot():
+    for sample, value in samples:
         lines.append(f"{sample} {value}")
 
     if len(lines) == 2:
@@ -50,7 +72,9 @@ def render(service_version: str) -> str:
             f'blackskies_service_info{{version="{service_version}"}} 1',
         ]
     )
-    return "\n".join(lines) + "\n"
+    rendered = "\n".join(lines) + "\n"
+    _RENDER_CACHE = (generation, service_version, rendered)
+    return rendered
 
 
 __all__ = ["record_request", "render"]
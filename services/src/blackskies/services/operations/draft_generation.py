@@ -8,8 +8,8 @@ import hashlib
 import json
 from dataclasses import dataclass
 from pathlib import Path
+from secrets import token_hex
 from typing import Any, Sequence
-from uuid import uuid4
 
 from ..config import ServiceSettings
 from ..diagnostics import DiagnosticLogger
@@ -501,7 +501,7 @@ class DraftGenerationService:
                 }
             )
 
-        draft_id = f"dr_{uuid4().hex[:8]}"
+        draft_id = f"dr_{token_hex(4)}"
 
         response_payload = {
             "project_id": request.project_id,
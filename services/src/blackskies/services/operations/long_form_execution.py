@@ -5,8 +5,8 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
+from secrets import token_hex
 from typing import Any, Iterable
-from uuid import uuid4
 
 from ..budgeting import classify_budget
 from ..diagnostics import DiagnosticLogger
@@ -94,7 +94,7 @@ class LongFormExecutionService:
         stopped_reason: str | None = None
 
         for order, chunk_scene_ids in enumerate(chunk_plan, start=1):
-            chunk_id = f"lf_{uuid4().hex[:8]}"
+            chunk_id = f"lf_{token_hex(4)}"
             estimated_cost = self._estimate_chunk_cost(
                 target_words_per_chunk,
                 len(chunk_scene_ids),
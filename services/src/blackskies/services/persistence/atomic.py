@@ -41,6 +41,26 @@ def flush_handle(handle: IO[Any], *, durable: bool) -> None:
         os.fsync(handle.fileno())
 
 
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+
+
+def write_file_bytes(path: Path, data: bytes, *, durable: bool) -> None:
+    """Write ``data`` to ``path`` through a raw descriptor, skipping Python's buffered I/O."""
+
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 _TRANSIENT_ERRNOS = {errno.EACCES, errno.EPERM}
 _TRANSIENT_WINERRORS = {5, 32}
 
@@ -120,6 +140,7 @@ __all__ = [
     "flush_handle",
     "locked_path",
     "replace_file",
+    "write_file_bytes",
     "write_json_atomic",
     "write_text_atomic",
 ]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 from ..config import ServiceSettings
@@ -25,13 +26,24 @@ class OutlinePersistence:
         project_root.mkdir(parents=True, exist_ok=True)
         return project_root
 
-    def write_outline(self, project_id: str, outline: OutlineArtifact) -> Path:
-        """Validate and atomically write the outline artifact to disk."""
+    def write_outline(
+        self,
+        project_id: str,
+        outline: OutlineArtifact,
+        *,
+        payload: dict[str, Any] | None = None,
+    ) -> Path:
+        """Validate and atomically write the outline artifact to disk.
+
+        Callers that already hold ``outline.model_dump(mode="json")`` can pass it as
+        ``payload`` to avoid dumping the model twice.
+        """
 
         project_root = self.ensure_project_root(project_id)
         target_path = project_root / "outline.json"
 
-        payload = outline.model_dump(mode="json")
+        if payload is None:
+            payload = outline.model_dump(mode="json")
         serialized = json.dumps(payload, indent=2, ensure_ascii=False)
 
         with locked_path(target_path):
@@ -8,9 +8,9 @@ import shutil
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from secrets import token_hex
 from threading import Lock
 from typing import Any, Sequence
-from uuid import uuid4
 
 from blackskies.services.utils import safe_dump, to_posix
 
@@ -48,7 +48,7 @@ class SnapshotPersistence:
                 self._last_snapshot_prefix = base
         if not suffix_required:
             return base
-        return f"{base}-{uuid4().hex[:8]}"
+        return f"{base}-{token_hex(4)}"
 
     def _sanitize_label(self, label: str | None) -> str:
         if not label:
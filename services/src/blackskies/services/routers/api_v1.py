@@ -17,17 +17,20 @@ from .restore import router as restore_router
 from .snapshots import router as snapshots_router
 
 router = APIRouter(prefix="/api/v1")
-router.include_router(outline_router)
-router.include_router(draft_router)
-router.include_router(recovery_router)
-router.include_router(analytics_router)
-router.include_router(snapshots_router)
-router.include_router(backup_verifier_router)
-router.include_router(backups_router)
-router.include_router(export_router)
-router.include_router(long_form_router)
-router.include_router(phase4_router)
-router.include_router(restore_router)
-router.include_router(restore_router)
+for _child in (
+    outline_router,
+    draft_router,
+    recovery_router,
+    analytics_router,
+    snapshots_router,
+    backup_verifier_router,
+    backups_router,
+    export_router,
+    long_form_router,
+    phase4_router,
+    restore_router,
+):
+    router.include_router(_child)
+del _child
 
 __all__ = ["router"]
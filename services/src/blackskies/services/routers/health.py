@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from ..metrics import render
 from ..feature_flags import voice_notes_enabled
@@ -17,6 +18,14 @@ router = APIRouter(prefix="/api/v1", tags=["health"])
 
 _METRICS_MEDIA_TYPE = "text/plain; version=0.0.4"
 
+# Plain routes bypass the app's default_response_class, so mirror its orjson choice here.
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    _PROBE_RESPONSE_CLASS: type[JSONResponse] = JSONResponse
+else:
+    _PROBE_RESPONSE_CLASS = ORJSONResponse
+
 
 def get_service_version(request: Request) -> str:
     """Return the service version attached to the application state."""
@@ -53,16 +62,24 @@ def _health_payload(request: Request, version: str) -> dict[str, Any]:
     return payload
 
 
-@router.get("/healthz")
-async def health(request: Request, version: str = Depends(get_service_version)) -> dict[str, Any]:
-    return _health_payload(request, version)
+async def health(request: Request) -> Response:
+    """Return the service health payload."""
+
+    return _PROBE_RESPONSE_CLASS(_health_payload(request, get_service_version(request)))
 
 
-@router.get("/metrics")
-async def metrics_endpoint(version: str = Depends(get_service_version)) -> Response:
+async def metrics_endpoint(request: Request) -> Response:
     """Return the Prometheus metrics payload without implicit charsets."""
 
-    metrics_payload = render(version).encode("utf-8")
+    metrics_payload = render(get_service_version(request)).encode("utf-8")
     response = Response(content=metrics_payload)
     response.headers["Content-Type"] = _METRICS_MEDIA_TYPE
     return response
+
+
+# Probes are registered as plain Starlette routes so they skip FastAPI's dependency
+# resolution and response-model serialisation on every liveness/readiness poll.
+router.add_route(f"{router.prefix}/healthz", health, methods=["GET"], include_in_schema=False)
+router.add_route(
+    f"{router.prefix}/metrics", metrics_endpoint, methods=["GET"], include_in_schema=False
+)
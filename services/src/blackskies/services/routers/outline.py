@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import ValidationError
 
 from ..config import ServiceSettings
@@ -96,8 +97,13 @@ async def build_outline(
     try:
         async with tracker.track(request_model.project_id):
             outline = builder.build(request_model)
-            persistence.write_outline(request_model.project_id, outline)
             response_payload = outline.model_dump(mode="json")
+            await run_in_threadpool(
+                persistence.write_outline,
+                request_model.project_id,
+                outline,
+                payload=response_payload,
+            )
     except BuildInProgressError as exc:
         LOGGER.warning("Outline build conflict for project %s", request_model.project_id)
         diagnostics.log(
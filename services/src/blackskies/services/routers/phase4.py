@@ -21,15 +21,19 @@ from ..models.phase4_loop import (
 router = APIRouter(prefix="/phase4", tags=["phase4"])
 
 
+_MODE_LABELS: dict[CritiqueMode, str] = {
+    mode: mode.value.replace("_", " ").title() for mode in CritiqueMode
+}
+
+
 def _split_lines(text: str) -> list[str]:
-    return [line.strip() for line in text.splitlines() if line.strip()]
+    return [stripped for line in text.splitlines() if (stripped := line.strip())]
 
 
-def _build_summary(text: str, mode: CritiqueMode) -> str:
+def _build_summary(text: str, mode: CritiqueMode, line_count: int) -> str:
     word_count = len(text.split())
-    lines = len(_split_lines(text))
-    mode_label = mode.value.replace("_", " ").title()
-    return f"Mock {mode_label} critique covers {word_count} words across {lines} line(s)."
+    mode_label = _MODE_LABELS[mode]
+    return f"Mock {mode_label} critique covers {word_count} words across {line_count} line(s)."
 
 
 def _build_issues(lines: list[str]) -> list[Phase4Issue]:
@@ -62,28 +66,28 @@ def _build_issues(lines: list[str]) -> list[Phase4Issue]:
     return issues
 
 
-_MODE_SUGGESTIONS: dict[CritiqueMode, list[str]] = {
-    CritiqueMode.line_edit: [
+_MODE_SUGGESTIONS: dict[CritiqueMode, tuple[str, ...]] = {
+    CritiqueMode.line_edit: (
         "Read aloud to catch stumbles and tighten phrasing.",
         "Swap passive verbs for stronger active beats.",
-    ],
-    CritiqueMode.big_picture: [
+    ),
+    CritiqueMode.big_picture: (
         "Ensure motivation arcs each beat.",
         "Revisit the midpoint thrust to keep stakes aligned.",
-    ],
-    CritiqueMode.pacing: [
+    ),
+    CritiqueMode.pacing: (
         "Balance long sentences with short payoffs for rhythm.",
         "Add a brief pause or tag moment mid-scene.",
-    ],
-    CritiqueMode.tone: [
+    ),
+    CritiqueMode.tone: (
         "Amplify sensory anchors to secure atmosphere.",
         "Contrast solace with menace in alternating beats.",
-    ],
+    ),
 }
 
 
 def _build_suggestions(mode: CritiqueMode) -> list[str]:
-    return _MODE_SUGGESTIONS.get(mode, _MODE_SUGGESTIONS[CritiqueMode.big_picture])
+    return list(_MODE_SUGGESTIONS.get(mode, _MODE_SUGGESTIONS[CritiqueMode.big_picture]))
 
 
 def _mock_rewrite(original_text: str, instructions: str | None) -> str:
@@ -109,11 +113,14 @@ async def critique_phase4(payload: Phase4CritiqueRequest) -> Phase4CritiqueRespo
         return e2e_phase4_critique_response(payload.scene_id)
 
     normalized_text = payload.text.strip()
-    summary = _build_summary(normalized_text, payload.mode)
     lines = _split_lines(normalized_text)
+    summary = _build_summary(normalized_text, payload.mode, len(lines))
     issues = _build_issues(lines)
     suggestions = _build_suggestions(payload.mode)
-    return Phase4CritiqueResponse(summary=summary, issues=issues, suggestions=suggestions)
+    # Every field is assembled from validated inputs and module constants above.
+    return Phase4CritiqueResponse.model_construct(
+        summary=summary, issues=issues, suggestions=suggestions
+    )
 
 
 @router.post("/rewrite", response_model=Phase4RewriteResponse)
@@ -124,4 +131,4 @@ async def rewrite_phase4(payload: Phase4RewriteRequest) -> Phase4RewriteResponse
         return e2e_phase4_rewrite_response(payload.scene_id, payload.instructions)
 
     revised_text = _mock_rewrite(payload.original_text, payload.instructions)
-    return Phase4RewriteResponse(revised_text=revised_text)
+    return Phase4RewriteResponse.model_construct(revised_text=revised_text)
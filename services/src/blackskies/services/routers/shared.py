@@ -6,8 +6,11 @@ from datetime import datetime, timezone
 
 __all__ = ["utc_timestamp"]
 
+_UTC = timezone.utc
+
 
 def utc_timestamp() -> str:
     """Return an ISO-8601 UTC timestamp with ``Z`` suffix."""
 
-    return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    # ``isoformat`` on an aware UTC datetime always ends in ``+00:00``.
+    return datetime.now(_UTC).isoformat()[:-6] + "Z"
@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from secrets import token_hex
+from typing import Any, Dict, Iterator, List, Optional
 
 from .config import ServiceSettings
 from .history import project_history_subdir
 from .io import atomic_write_json, read_json
+from .persistence.atomic import locked_path
+
+# Ledger path -> events buffered by an active ``batch_events`` block in this context.
+_EVENT_BUFFERS: ContextVar[Dict[Path, List[Dict[str, Any]]] | None] = ContextVar(
+    "blackskies_run_event_buffers", default=None
+)
+
 
 def _timestamp() -> str:
     return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
@@ -51,7 +60,7 @@ def _ledger_path(run_id: str, project_root: Path | None) -> Path:
 def start_run(kind: str, params: Dict[str, Any], *, project_root: Path | None = None) -> Dict[str, Any]:
     """Create a new run ledger entry and return the metadata."""
 
-    run_id = f"{kind}-{uuid4().hex[:8]}"
+    run_id = f"{kind}-{token_hex(4)}"
     created_at = _timestamp()
     run_dir = _ensure_directory(_run_dir(run_id, project_root))
     metadata: Dict[str, Any] = {
@@ -76,22 +85,55 @@ def append_event(
     *,
     project_root: Path | None = None,
 ) -> Dict[str, Any]:
-    """Append an event to the run ledger."""
+    """Append an event to the run ledger.
+
+    Inside :func:`batch_events` the event is buffered and its ``id`` is assigned when the
+    batch is written.
+    """
 
     ledger_path = _ledger_path(run_id, project_root)
-    metadata = read_json(ledger_path)
-    event = {
-        "id": len(metadata.get("events", [])) + 1,
-        "timestamp": _timestamp(),
-        "type": event_type,
-        "payload": payload,
-    }
-    metadata.setdefault("events", []).append(event)
-    metadata["updated_at"] = _timestamp()
-    atomic_write_json(ledger_path, metadata)
+    event = {"id": 0, "timestamp": _timestamp(), "type": event_type, "payload": payload}
+    buffers = _EVENT_BUFFERS.get()
+    if buffers is not None and ledger_path in buffers:
+        buffers[ledger_path].append(event)
+    else:
+        _write_events(ledger_path, [event])
     return event
 
 
+@contextmanager
+def batch_events(run_id: str, *, project_root: Path | None = None) -> Iterator[None]:
+    """Buffer ``append_event`` calls for ``run_id`` and write them in one ledger update."""
+
+    ledger_path = _ledger_path(run_id, project_root)
+    buffers = _EVENT_BUFFERS.get()
+    if buffers is not None and ledger_path in buffers:
+        # Nested batch for the same run: the outermost block writes.
+        yield
+        return
+
+    pending: List[Dict[str, Any]] = []
+    token = _EVENT_BUFFERS.set({**(buffers or {}), ledger_path: pending})
+    try:
+        yield
+    finally:
+        _EVENT_BUFFERS.reset(token)
+        if pending:
+            _write_events(ledger_path, pending)
+
+
+def _write_events(ledger_path: Path, events: List[Dict[str, Any]]) -> None:
+    # Hold the path lock across read-modify-write so concurrent appends are not lost.
+    with locked_path(ledger_path):
+        metadata = read_json(ledger_path)
+        stored = metadata.setdefault("events", [])
+        for event in events:
+            event["id"] = len(stored) + 1
+            stored.append(event)
+        metadata["updated_at"] = _timestamp()
+        atomic_write_json(ledger_path, metadata)
+
+
 def finalize_run(
     run_id: str,
     *,
@@ -102,13 +144,21 @@ def finalize_run(
     """Mark a run as finished and persist the final metadata."""
 
     ledger_path = _ledger_path(run_id, project_root)
-    metadata = read_json(ledger_path)
-    metadata["status"] = status
-    metadata["updated_at"] = _timestamp()
-    if result is not None:
-        metadata["result"] = result
-    atomic_write_json(ledger_path, metadata)
+    with locked_path(ledger_path):
+        metadata = read_json(ledger_path)
+        metadata["status"] = status
+        metadata["updated_at"] = _timestamp()
+        if result is not None:
+            metadata["result"] = result
+        atomic_write_json(ledger_path, metadata)
     return metadata
 
 
-__all__ = ["start_run", "append_event", "finalize_run", "get_runs_root", "RUNS_ROOT"]
+__all__ = [
+    "start_run",
+    "append_event",
+    "batch_events",
+    "finalize_run",
+    "get_runs_root",
+    "RUNS_ROOT",
+]
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, Mapping
 
 from .agents.base import BaseAgent, CritiqueAgent, DraftAgent, OutlineAgent, RewriteAgent
@@ -16,6 +16,16 @@ OperationPayload = Dict[str, Any]
 OperationResult = Dict[str, Any]
 
 
+@lru_cache(maxsize=None)
+def _agent_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the pool shared by orchestrators configured with ``max_workers`` threads.
+
+    Sharing it lets parallel runs reuse warm threads instead of spawning a pool per call.
+    """
+
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent")
+
+
 class ToolNotPermittedError(PermissionError):
     """Raised when a tool invocation is blocked by the registry."""
 
@@ -138,17 +148,18 @@ class AgentOrchestrator:
     ) -> tuple[OperationResult, OperationResult]:
         """Run outline and draft in parallel using a thread pool."""
 
-        operations = {
-            "outline": ("outline", outline_payload),
-            "draft": ("draft", draft_payload),
-        }
-        with ThreadPoolExecutor(max_workers=len(operations)) as executor:
-            futures = {
-                name: executor.submit(self._run_agent, agent_name, payload)
-                for name, (agent_name, payload) in operations.items()
-            }
-            # Always return results in outline->draft order for stable callers.
-            return futures["outline"].result(), futures["draft"].result()
+        executor = _agent_executor(self.settings.agent_max_workers)
+        outline_future = executor.submit(self._run_agent, "outline", outline_payload)
+        draft_future = executor.submit(self._run_agent, "draft", draft_payload)
+        try:
+            outline_result = outline_future.result()
+        except BaseException:
+            # Do not leave the draft agent running unobserved behind a failed outline.
+            if not draft_future.cancel():
+                wait((draft_future,))
+            raise
+        # Always return results in outline->draft order for stable callers.
+        return outline_result, draft_future.result()
 
     def _run_agent(self, name: str, payload: OperationPayload) -> OperationResult:
         """Dispatch to a registered agent by name."""
@@ -30,6 +30,12 @@ def _default_project_dir() -> Path:
     return cwd_candidate
 
 
+def _default_agent_max_workers() -> int:
+    """Size the shared agent pool like ``ThreadPoolExecutor`` does for I/O-bound work."""
+
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
 Mode = Literal["offline", "live", "mock", "companion"]
 VALID_MODES: tuple[Mode, ...] = ("offline", "live", "mock", "companion")
 
@@ -72,6 +78,14 @@ class Settings(BaseSettings):
             "PROJECT_BASE_DIR",
         ),
     )
+    agent_max_workers: int = Field(
+        default_factory=_default_agent_max_workers,
+        ge=2,
+        validation_alias=AliasChoices(
+            "BLACK_SKIES_AGENT_MAX_WORKERS",
+            "AGENT_MAX_WORKERS",
+        ),
+    )
 
     @field_validator("black_skies_mode", mode="before")
     @classmethod
@@ -100,10 +114,17 @@ class Settings(BaseSettings):
             )
 
 
+# Containers that inject configuration purely via the environment can skip the .env read.
+_SKIP_DOTENV_ENV = "BLACK_SKIES_SKIP_DOTENV"
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Return a cached settings instance."""
 
+    if os.getenv(_SKIP_DOTENV_ENV):
+        # ``_env_file`` is a pydantic-settings init option that mypy does not see.
+        return Settings(_env_file=None)  # type: ignore[call-arg]
     return Settings()
 
 
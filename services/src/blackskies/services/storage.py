@@ -6,9 +6,16 @@ import json
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+from uuid import uuid4
 
 from .config import ServiceSettings
+from .persistence.atomic import locked_path, replace_file, write_file_bytes
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = cast("Any", None)
 
 _KIND_SUBDIRS: dict[str, str] = {
     "outline": "outlines",
@@ -30,16 +37,19 @@ def _resolve_base_dir(base_dir: Path | ServiceSettings) -> Path:
     return resolved
 
 
-@lru_cache(maxsize=None)
-def _ensure_kind_dir(base_path: Path, kind: str) -> Path:
+def _kind_dir(base_path: Path, kind: str) -> Path:
     try:
         subdir = _KIND_SUBDIRS[kind]
     except KeyError as exc:  # pragma: no cover - defensive guard
         raise ValueError(f"Unknown storage kind: {kind}") from exc
+    return base_path / subdir
 
-    target_dir = base_path / subdir
-    target_dir.mkdir(parents=True, exist_ok=True)
-    return target_dir
+
+@lru_cache(maxsize=None)
+def _ensure_dir(directory: Path) -> None:
+    """Create ``directory`` once per process; later writes skip the mkdir syscall."""
+
+    directory.mkdir(parents=True, exist_ok=True)
 
 
 def path_for(
@@ -54,12 +64,21 @@ def path_for(
         raise ValueError("Identifier must be a non-empty string.")
 
     base_path = _resolve_base_dir(base_dir)
-    directory = _ensure_kind_dir(base_path, kind)
-    return directory / f"{identifier}.json"
+    return _kind_dir(base_path, kind) / f"{identifier}.json"
 
 
-def save(obj: dict[str, Any], *, base_dir: Path | ServiceSettings) -> Path:
-    """Persist a model dict using its kind and id fields."""
+def save(
+    obj: dict[str, Any],
+    *,
+    base_dir: Path | ServiceSettings,
+    durable: bool = False,
+) -> Path:
+    """Persist a model dict using its kind and id fields.
+
+    The record is written to a temporary sibling and renamed into place, so readers
+    never observe a partially written file. Pass ``durable=True`` to fsync before the
+    rename.
+    """
 
     kind = obj.get("kind")
     identifier = obj.get("id")
@@ -68,8 +87,12 @@ def save(obj: dict[str, Any], *, base_dir: Path | ServiceSettings) -> Path:
     if not kind or not identifier:
         raise ValueError("'kind' and 'id' must be non-empty strings.")
     target = path_for(kind, identifier, base_dir=base_dir)
-    with target.open("w", encoding="utf-8") as handle:
-        json.dump(obj, handle, indent=2, ensure_ascii=False, default=_json_default)
+    serialized = _dumps(obj)
+    _ensure_dir(target.parent)
+    with locked_path(target):
+        temp_path = target.parent / f".{target.name}.{uuid4().hex}.tmp"
+        write_file_bytes(temp_path, serialized, durable=durable)
+        replace_file(temp_path, target)
     return target
 
 
@@ -84,12 +107,22 @@ def load(
     target = path_for(kind, identifier, base_dir=base_dir)
     if not target.exists():
         raise FileNotFoundError(f"No {kind} stored with id {identifier} at {target}.")
-    with target.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    data = target.read_bytes()
+    if orjson is not None:
+        return cast(dict[str, Any], orjson.loads(data))
+    return cast(dict[str, Any], json.loads(data))
+
+
+def _dumps(obj: dict[str, Any]) -> bytes:
+    """Serialise ``obj`` as compact UTF-8 JSON, preferring orjson when installed."""
+
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS))
+    serialized = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+    return serialized.encode("utf-8")
 
 
 def _json_default(value: Any) -> Any:
     if isinstance(value, datetime):
         return value.isoformat()
     raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
-
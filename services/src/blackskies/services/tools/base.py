@@ -100,10 +100,11 @@ def log_tool_event(
 ) -> None:
     """Emit a structured log entry for a tool event."""
 
+    if not tool_logger.isEnabledFor(logging.INFO):
+        return
     base_payload = context.extra_payload()
     if payload:
-        extra_data: Dict[str, Any] = dict(payload)
-        base_payload.update(extra_data)
+        base_payload.update(payload)
     tool_logger.info(event, extra={"extra_payload": base_payload})
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import unicodedata
 from dataclasses import dataclass
@@ -55,55 +56,74 @@ _TOOL_ALIASES: Mapping[str, str] = {
 }
 
 
+@lru_cache(maxsize=512)
 def _slugify(value: str) -> str:
     """Return a normalized slug suitable for dictionary lookups."""
 
-    normalized = unicodedata.normalize("NFKD", value)
-    normalized = normalized.encode("ascii", "ignore").decode("ascii")
-    normalized = normalized.lower()
+    if value.isascii():
+        # NFKD and the ASCII round-trip are no-ops for ASCII input, the common case.
+        normalized = value.lower()
+    else:
+        normalized = unicodedata.normalize("NFKD", value)
+        normalized = normalized.encode("ascii", "ignore").decode("ascii").lower()
     normalized = normalized.replace("'", "")
     normalized = _NON_ALNUM_RE.sub("_", normalized)
     return normalized.strip("_")
 
 
+_TOOL_CHECKLIST_SLUGS: Mapping[str, str] = {
+    tool: _slugify(label) for tool, label in _TOOL_CHECKLIST_LABELS.items()
+}
+
+
 class ChecklistEntry(TypedDict):
     text: str
     ai: bool
 
 
-@lru_cache(maxsize=4)
 def _load_checklist_index(checklist_path: str) -> Dict[str, ChecklistEntry]:
-    """Parse the decision checklist and index entries by slug."""
+    """Return the checklist index, re-parsing only when the file changes on disk."""
 
-    path = Path(checklist_path)
-    if not path.exists():  # pragma: no cover - defensive guard
-        raise FileNotFoundError(f"Decision checklist not found at {path}")
+    try:
+        stat = os.stat(checklist_path)
+    except FileNotFoundError as exc:  # pragma: no cover - defensive guard
+        raise FileNotFoundError(f"Decision checklist not found at {checklist_path}") from exc
+    return _parse_checklist_index(checklist_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _parse_checklist_index(
+    checklist_path: str, mtime_ns: int, size: int
+) -> Dict[str, ChecklistEntry]:
+    """Parse the decision checklist and index entries by slug."""
 
     index: Dict[str, ChecklistEntry] = {}
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line.startswith("- ["):
-            continue
-        try:
-            marker_end = line.index("]")
-        except ValueError:  # pragma: no cover - malformed data guard
-            continue
-        tag = line[3:marker_end]
-        if tag not in {"AI", "H"}:
-            continue
-        content = line[marker_end + 1 :].strip()
-        if "→" in content:
-            content = content.split("→", 1)[0].strip()
-        slug = _slugify(content)
-        if not slug:
-            continue
-        index[slug] = {
-            "text": content,
-            "ai": tag == "AI",
-        }
+    with open(checklist_path, "r", encoding="utf-8") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line.startswith("- ["):
+                continue
+            try:
+                marker_end = line.index("]")
+            except ValueError:  # pragma: no cover - malformed data guard
+                continue
+            tag = line[3:marker_end]
+            if tag not in {"AI", "H"}:
+                continue
+            content = line[marker_end + 1 :].strip()
+            if "→" in content:
+                content = content.split("→", 1)[0].strip()
+            slug = _slugify(content)
+            if not slug:
+                continue
+            index[slug] = {
+                "text": content,
+                "ai": tag == "AI",
+            }
     return index
 
 
+@lru_cache(maxsize=256)
 def _normalize_tool_name(name: str) -> str:
     candidate = _slugify(name)
     if candidate.endswith("_tool"):
@@ -115,6 +135,14 @@ def _lower_set(items: Iterable[str]) -> set[str]:
     return {_normalize_tool_name(item) for item in items}
 
 
+# (allowed, source, reason) outcomes, resolved once per check_permission call.
+_PROJECT_DENY = (False, "project.deny", "Project configuration denies this tool")
+_PROJECT_ALLOW = (True, "project.allow", "Project configuration allows this tool")
+_CHECKLIST_AI = (True, "checklist.ai", "Checklist item marked AI-recommendable")
+_CHECKLIST_HUMAN = (False, "checklist.human", "Checklist item requires human decision")
+_CHECKLIST_UNKNOWN = (False, "checklist.unknown", "No checklist entry found; defaulting to deny")
+
+
 class ToolRegistry:
     """Central registry for checking whether a tool invocation is permitted."""
 
@@ -144,18 +172,20 @@ class ToolRegistry:
         self._checklist_index: Dict[str, ChecklistEntry] = _load_checklist_index(
             str(checklist_source)
         )
-        self._tool_checklist_slugs: Dict[str, str] = {
-            tool: _slugify(label) for tool, label in _TOOL_CHECKLIST_LABELS.items()
-        }
+        self._tool_checklist_slugs: Mapping[str, str] = _TOOL_CHECKLIST_SLUGS
+        # Decisions depend only on state fixed at construction, so each is computed once.
+        self._decisions: Dict[tuple[str, str | None], ToolDecision] = {}
 
     @staticmethod
     def _load_project_metadata(project_path: Path) -> Mapping[str, Any]:
         path = project_path
         if path.is_dir():
             path = path / "project.json"
-        if not path.exists():  # pragma: no cover - defensive guard
-            raise FileNotFoundError(f"Project metadata not found at {path}")
-        with path.open("r", encoding="utf-8") as handle:
+        try:
+            handle = path.open("r", encoding="utf-8")
+        except FileNotFoundError as exc:  # pragma: no cover - defensive guard
+            raise FileNotFoundError(f"Project metadata not found at {path}") from exc
+        with handle:
             return json.load(handle)
 
     @property
@@ -165,9 +195,15 @@ class ToolRegistry:
     def canonical_name(self, tool_name: str) -> str:
         return _normalize_tool_name(tool_name)
 
-    def _default_decision(self, tool: str, checklist_item: str | None) -> ToolDecision:
+    def _resolve_checklist(
+        self, tool: str, checklist_item: str | None
+    ) -> tuple[str | None, str | None, bool | None]:
+        """Return ``(slug, label, ai)`` for the governing checklist entry.
+
+        ``ai`` is ``None`` when no checklist entry matches.
+        """
+
         slug: Optional[str]
-        label: Optional[str]
         entry: ChecklistEntry | None = None
         if checklist_item:
             slug = _slugify(checklist_item)
@@ -176,35 +212,37 @@ class ToolRegistry:
             slug = self._tool_checklist_slugs.get(tool)
             entry = self._checklist_index.get(slug) if slug else None
 
-        label = entry["text"] if entry else None
-
-        if slug and entry:
-            is_ai = entry["ai"]
-            if is_ai:
-                return ToolDecision(
-                    tool=tool,
-                    allowed=True,
-                    source="checklist.ai",
-                    reason="Checklist item marked AI-recommendable",
-                    checklist_item=label,
-                    checklist_slug=slug,
-                )
-            return ToolDecision(
-                tool=tool,
-                allowed=False,
-                source="checklist.human",
-                reason="Checklist item requires human decision",
-                checklist_item=label,
-                checklist_slug=slug,
-            )
-        return ToolDecision(
+        if entry is None:
+            return slug, None, None
+        return slug, entry["text"], (entry["ai"] if slug else None)
+
+    def _decide(self, tool: str, checklist_item: str | None) -> ToolDecision:
+        key = (tool, checklist_item)
+        cached = self._decisions.get(key)
+        if cached is not None:
+            return cached
+
+        checklist_slug, checklist_label, checklist_ai = self._resolve_checklist(
+            tool, checklist_item
+        )
+        if self._deny_all or tool in self._deny_overrides:
+            outcome = _PROJECT_DENY
+        elif self._allow_all or tool in self._allow_overrides:
+            outcome = _PROJECT_ALLOW
+        elif checklist_ai is None:
+            outcome = _CHECKLIST_UNKNOWN
+        else:
+            outcome = _CHECKLIST_AI if checklist_ai else _CHECKLIST_HUMAN
+        allowed, source, reason = outcome
+        decision = ToolDecision(
             tool=tool,
-            allowed=False,
-            source="checklist.unknown",
-            reason="No checklist entry found; defaulting to deny",
-            checklist_item=label,
-            checklist_slug=slug,
+            allowed=allowed,
+            source=source,
+            reason=reason,
+            checklist_item=checklist_label,
+            checklist_slug=checklist_slug,
         )
+        return self._decisions.setdefault(key, decision)
 
     def check_permission(
         self,
@@ -234,37 +272,19 @@ class ToolRegistry:
             if self._project_id:
                 violation_payload["project_id"] = self._project_id
             if metadata:
-                violation_payload["context"] = dict(metadata)
+                violation_payload["context"] = metadata
             if exc.details:
-                violation_payload["details"] = dict(exc.details)
+                violation_payload["details"] = exc.details
+            # postflight_scrub deep-copies mappings, so the payload can be handed on as-is.
             sanitized_violation = postflight_scrub(violation_payload)
-            runs.append_event(run_id, "tool.safety_violation", dict(sanitized_violation))
+            runs.append_event(run_id, "tool.safety_violation", sanitized_violation)
             error_logger.info(
                 "tool.safety_violation",
                 extra={"extra_payload": sanitized_violation},
             )
             raise
 
-        decision = self._default_decision(tool, checklist_item)
-
-        if self._deny_all or tool in self._deny_overrides:
-            decision = ToolDecision(
-                tool=tool,
-                allowed=False,
-                source="project.deny",
-                reason="Project configuration denies this tool",
-                checklist_item=decision.checklist_item,
-                checklist_slug=decision.checklist_slug,
-            )
-        elif self._allow_all or tool in self._allow_overrides:
-            decision = ToolDecision(
-                tool=tool,
-                allowed=True,
-                source="project.allow",
-                reason="Project configuration allows this tool",
-                checklist_item=decision.checklist_item,
-                checklist_slug=decision.checklist_slug,
-            )
+        decision = self._decide(tool, checklist_item)
 
         payload: MutableMapping[str, Any] = {
             "tool": tool,
@@ -282,11 +302,11 @@ class ToolRegistry:
         if decision.checklist_item:
             payload["checklist_item"] = decision.checklist_item
         if metadata:
-            payload["context"] = dict(metadata)
+            payload["context"] = metadata
 
         event_type = "tool.approved" if decision.allowed else "tool.denied"
         sanitized_payload = postflight_scrub(payload)
-        runs.append_event(run_id, event_type, dict(sanitized_payload))
+        runs.append_event(run_id, event_type, sanitized_payload)
 
         if not decision.allowed:
             logger.warning(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 from typing import Any, Mapping
@@ -18,6 +19,24 @@ from .base import (
 )
 
 
+@lru_cache(maxsize=128)
+def _compiled_template(body: str) -> Template:
+    return Template(body)
+
+
+@lru_cache(maxsize=128)
+def _load_template_body(
+    base_dir: Path, template_id: str, revision: tuple[int, int, int, int]
+) -> Any:
+    """Return the stored template body.
+
+    ``revision`` is ``(st_ino, st_mtime_ns, st_ctime_ns, st_size)``, which keys the cache to the
+    file revision so atomic replacements and same-size rewrites within one mtime tick still miss.
+    """
+
+    return storage.load("template", template_id, base_dir=base_dir).get("body")
+
+
 class TemplateRendererTool:
     """Adapter that retrieves template definitions via :mod:`blackskies.services.storage`."""
 
@@ -45,6 +64,16 @@ class TemplateRendererTool:
     ) -> ToolInvocationContext:
         return ToolInvocationContext(name=self.name, trace_id=trace_id, metadata=metadata or {})
 
+    def _load_body(self, template_id: str) -> Any:
+        path = storage.path_for("template", template_id, base_dir=self._base_dir)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Defer to storage for the canonical missing-record error.
+            return storage.load("template", template_id, base_dir=self._base_dir).get("body")
+        revision = (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+        return _load_template_body(self._base_dir, template_id, revision)
+
     def render(
         self, context: ToolContext, template_id: str, variables: Mapping[str, Any]
     ) -> ToolExecutionResult[str]:
@@ -58,64 +87,53 @@ class TemplateRendererTool:
         operation_payload = {"operation": "render", "template_id": template_id}
         log_tool_start(context, **operation_payload)
         try:
-            record = storage.load("template", template_id, base_dir=self._base_dir)
+            body = self._load_body(template_id)
         except Exception as exc:
             log_tool_complete(
                 context,
-                **{
-                    **operation_payload,
-                    "status": "error",
-                    "error_type": exc.__class__.__name__,
-                    "message": str(exc),
-                },
+                **operation_payload,
+                status="error",
+                error_type=exc.__class__.__name__,
+                message=str(exc),
             )
             raise
 
-        body = record.get("body")
         if not isinstance(body, str) or not body:
             log_tool_complete(
                 context,
-                **{
-                    **operation_payload,
-                    "status": "error",
-                    "error_type": "InvalidTemplate",
-                    "message": "missing body",
-                },
+                **operation_payload,
+                status="error",
+                error_type="InvalidTemplate",
+                message="missing body",
             )
             raise ValueError("Template record must include a non-empty 'body' string.")
 
         try:
-            rendered = Template(body).substitute(**dict(variables))
+            rendered = _compiled_template(body).substitute(variables)
         except KeyError as exc:
             log_tool_complete(
                 context,
-                **{
-                    **operation_payload,
-                    "status": "error",
-                    "error_type": "MissingVariable",
-                    "missing": exc.args[0],
-                },
+                **operation_payload,
+                status="error",
+                error_type="MissingVariable",
+                missing=exc.args[0],
             )
             raise ValueError(f"Missing template variable: {exc.args[0]}") from exc
         except Exception as exc:
             log_tool_complete(
                 context,
-                **{
-                    **operation_payload,
-                    "status": "error",
-                    "error_type": exc.__class__.__name__,
-                    "message": str(exc),
-                },
+                **operation_payload,
+                status="error",
+                error_type=exc.__class__.__name__,
+                message=str(exc),
             )
             raise
 
         log_tool_complete(
             context,
-            **{
-                **operation_payload,
-                "status": "success",
-                "length": len(rendered),
-            },
+            **operation_payload,
+            status="success",
+            length=len(rendered),
         )
         return ToolExecutionResult(
             value=rendered, metadata={"template_id": template_id, "length": len(rendered)}
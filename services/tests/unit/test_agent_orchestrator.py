@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any, Callable, Dict, Mapping
 
 import pytest
 
+from blackskies.services.agents.base import AgentError, BaseAgent
 from blackskies.services.services import AgentOrchestrator, ToolNotPermittedError
 
 
@@ -91,6 +94,36 @@ def test_agent_orchestrator_runs_parallel_operations() -> None:
     assert draft_result["payload"] == {"value": "draft"}
 
 
+def test_parallel_outline_failure_waits_for_draft(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BaseAgent, "_backoff_sleep", lambda self, attempt: None)
+    workers = _make_workers()
+    draft_started = threading.Event()
+    draft_finished = threading.Event()
+
+    def _failing_outline(payload: Dict[str, Any]) -> Dict[str, Any]:
+        draft_started.wait(timeout=5)
+        raise RuntimeError("outline failed")
+
+    def _slow_draft(payload: Dict[str, Any]) -> Dict[str, Any]:
+        draft_started.set()
+        time.sleep(0.2)
+        draft_finished.set()
+        return workers["draft"](payload)
+
+    orchestrator = AgentOrchestrator(
+        _failing_outline,
+        _slow_draft,
+        workers["rewrite"],
+        workers["critique"],
+        tool_registry=DummyRegistry(),
+    )
+
+    with pytest.raises(AgentError, match="retry attempts"):
+        orchestrator.parallel_outline_and_draft({"value": "outline"}, {"value": "draft"})
+
+    assert draft_finished.is_set()
+
+
 def test_orchestrator_tool_registry_enforced() -> None:
     workers = _make_workers()
     orchestrator = AgentOrchestrator(
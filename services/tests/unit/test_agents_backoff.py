@@ -29,6 +29,12 @@ def test_exponential_backoff_bounds() -> None:
     assert backoff.compute(5) <= 4.0
 
 
+def test_exponential_backoff_schedule_matches_compute() -> None:
+    backoff = ExponentialBackoff(multiplier=0.5, min_interval=0.5, max_interval=4.0)
+    assert backoff.schedule(5) == (0.5, 1.0, 2.0, 4.0)
+    assert backoff.schedule(1) == ()
+
+
 def test_agent_retries_until_success() -> None:
     agent = _FlakyAgent(failures=2)
     result = agent.run({})
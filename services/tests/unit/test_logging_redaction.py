@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from datetime import datetime, timezone
 
 from blackskies.services.logging_config import JsonFormatter
 
@@ -43,3 +44,17 @@ def test_json_formatter_redacts_nested_sensitive_content() -> None:
     assert record["recipients"] == ["[REDACTED_EMAIL]", "[REDACTED_EMAIL]"]
     assert record["notes"][0]["token"] in {"[REDACTED_SECRET]", "[REDACTED]"}
     assert "[REDACTED_EMAIL]" in record["notes"][1]
+
+
+def test_json_formatter_emits_utc_iso_timestamp() -> None:
+    created = 1_700_000_000.123456
+    formatter = JsonFormatter()
+
+    first = json.loads(formatter.format(logging.makeLogRecord({"msg": "a", "created": created})))
+    second = json.loads(
+        formatter.format(logging.makeLogRecord({"msg": "b", "created": created + 0.5}))
+    )
+
+    expected = datetime.fromtimestamp(created, tz=timezone.utc)
+    assert datetime.fromisoformat(first["timestamp"]) == expected
+    assert second["timestamp"] == "2023-11-14T22:13:20.623456+00:00"
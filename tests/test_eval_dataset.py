@@ -119,3 +119,18 @@ def test_duplicate_task_identifiers(tmp_path: Path) -> None:
         load_dataset(dataset_dir)
 
     assert "Duplicate eval task id" in str(excinfo.value)
+
+
+def test_load_task_reuses_cache_until_card_changes(tmp_path: Path) -> None:
+    card = tmp_path / "cached.yaml"
+    source = (DEFAULT_DATASET_DIR / "wizard_outline_001.yaml").read_text(encoding="utf-8")
+    card.write_text(source, encoding="utf-8")
+
+    first = load_task(card)
+    assert load_task(card) is first
+
+    card.write_text(source.replace("wizard_outline_001", "wizard_outline_cached"), encoding="utf-8")
+    updated = load_task(card)
+
+    assert updated is not first
+    assert updated.task_id == "wizard_outline_cached"
@@ -114,3 +114,40 @@ def test_eval_harness_threshold_failure(tmp_path: Path, monkeypatch: pytest.Monk
     assert ledger["events"]
     assert ledger["events"][-1]["type"] == "eval.metrics"
     assert check_slo.main([str(ledgers[0])]) == 1
+
+
+@pytest.mark.eval
+def test_eval_harness_short_circuits_on_unreachable_threshold(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runs_root = tmp_path / "runs"
+    monkeypatch.setattr(runs, "RUNS_ROOT", runs_root, raising=False)
+
+    html_path = tmp_path / "out" / "eval.html"
+    json_path = tmp_path / "out" / "eval.json"
+
+    monkeypatch.setitem(eval_cli.FLOW_RUNNERS, EvalTaskFlow.WIZARD, _make_runner(False))
+    monkeypatch.setitem(eval_cli.FLOW_RUNNERS, EvalTaskFlow.DRAFT, _make_runner(False))
+    monkeypatch.setitem(eval_cli.FLOW_RUNNERS, EvalTaskFlow.CRITIQUE, _make_runner(False))
+
+    exit_code = eval_cli.main(
+        [
+            "--html",
+            str(html_path),
+            "--json",
+            str(json_path),
+            "--fail-under-pass-rate",
+            "1.0",
+            "--workers",
+            "1",
+            "--short-circuit-on-failure",
+        ]
+    )
+
+    assert exit_code == 1
+
+    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    report = payload["report"]
+    assert report["metrics"]["total"] == 1
+    assert report["metrics"]["failed"] == 1
+    assert any("tasks skipped" in reason for reason in payload["regressions"])
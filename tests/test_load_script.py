@@ -122,10 +122,6 @@ def test_build_profile_validates_positive_concurrency() -> None:
         load.build_profile("demo", raw, args)
 
 
-def test_distribute_cycles_balances_remainder() -> None:
-    assert list(load.distribute_cycles(10, 3)) == [4, 3, 3]
-
-
 def test_load_metrics_computations() -> None:
     metrics = load.LoadMetrics()
     metrics.record_request(method="GET", path="/a", status=200, elapsed_ms=100.0)
@@ -148,6 +144,28 @@ def test_load_metrics_computations() -> None:
     assert per_path["/b"]["p95_ms"] == pytest.approx(50.0)
 
 
+def test_load_metrics_percentiles_track_new_requests() -> None:
+    metrics = load.LoadMetrics()
+    metrics.record_request(method="GET", path="/a", status=200, elapsed_ms=100.0)
+    metrics.record_request(method="GET", path="/a", status=200, elapsed_ms=200.0)
+    assert metrics.percentiles(50.0, 100.0) == pytest.approx((150.0, 200.0))
+
+    metrics.record_request(method="GET", path="/a", status=200, elapsed_ms=400.0)
+    assert metrics.percentiles(50.0, 100.0) == pytest.approx((200.0, 400.0))
+
+
+def test_load_metrics_tail_percentile_matches_full_sort() -> None:
+    metrics = load.LoadMetrics()
+    for index in range(2000):
+        elapsed_ms = float((index * 7919) % 2000)
+        metrics.record_request(method="GET", path="/a", status=200, elapsed_ms=elapsed_ms)
+
+    p95 = metrics.percentile(95.0)
+    p1 = metrics.percentile(1.0)
+    assert metrics.percentiles(95.0, 1.0) == pytest.approx((p95, p1))
+    assert p95 == pytest.approx(1899.05)
+
+
 def test_evaluate_thresholds_detects_violations() -> None:
     metrics = load.LoadMetrics()
     metrics.requests = [
@@ -24,3 +24,15 @@ def test_metrics_endpoint_returns_prometheus_payload() -> None:
     metrics_response = client.get("/api/v1/metrics")
     assert metrics_response.status_code == 200
     assert "blackskies_requests_total" in metrics_response.text
+
+
+def test_metrics_render_reuses_output_until_counters_change() -> None:
+    from blackskies.services import metrics
+
+    first = metrics.render("test-version")
+    assert metrics.render("test-version") is first
+
+    metrics.record_request("GET", 299)
+    refreshed = metrics.render("test-version")
+    assert refreshed is not first
+    assert 'blackskies_requests_total{method="get",status="299"}' in refreshed
@@ -55,3 +55,22 @@ def test_finalize_run_marks_completed(tmp_path: Path, monkeypatch: pytest.Monkey
     assert stored["status"] == "completed"
     assert stored["result"] == {"summary": "ok"}
     assert final["status"] == "completed"
+
+
+def test_batch_events_writes_once_on_exit(tmp_path: Path) -> None:
+    project_root = tmp_path / "proj"
+    project_root.mkdir()
+    metadata = runs.start_run("eval", {}, project_root=project_root)
+    run_id = metadata["run_id"]
+    runs.append_event(run_id, "before", {}, project_root=project_root)
+
+    ledger_path = project_root / "history" / "runs" / run_id / "run.json"
+    with runs.batch_events(run_id, project_root=project_root):
+        first = runs.append_event(run_id, "step", {"n": 1}, project_root=project_root)
+        runs.append_event(run_id, "step", {"n": 2}, project_root=project_root)
+        assert len(json.loads(ledger_path.read_text("utf-8"))["events"]) == 1
+
+    stored = json.loads(ledger_path.read_text("utf-8"))
+    assert [event["id"] for event in stored["events"]] == [1, 2, 3]
+    assert [event["payload"].get("n") for event in stored["events"]] == [None, 1, 2]
+    assert first["id"] == 2
@@ -64,6 +64,23 @@ def test_get_settings_cached(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
     assert first is second
 
 
+def test_get_settings_can_skip_dotenv(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("BLACK_SKIES_MODE", raising=False)
+    monkeypatch.delenv("BLACK_SKIES_BLACK_SKIES_MODE", raising=False)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("BLACK_SKIES_MODE=mock\n", encoding="utf-8")
+
+    get_settings.cache_clear()
+    assert get_settings().black_skies_mode == "mock"
+
+    monkeypatch.setenv("BLACK_SKIES_SKIP_DOTENV", "1")
+    get_settings.cache_clear()
+    try:
+        assert get_settings().black_skies_mode == "offline"
+    finally:
+        get_settings.cache_clear()
+
+
 def test_settings_module_handles_missing_pydantic_settings(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -55,3 +56,53 @@ def test_build_accept_payload_shapes_request() -> None:
     assert payload["unit"]["previous_sha256"] == "abc123"
     assert payload["unit"]["estimated_cost_usd"] == 1.5
     assert payload["snapshot_label"] == "accept-sc_0001"
+
+
+def test_run_cycles_bounds_concurrency(
+    sample_project_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    in_flight = 0
+    peak = 0
+    seen: list[tuple[int, str, str]] = []
+
+    async def fake_wait_for_service(base_url: str, timeout: float) -> None:
+        return None
+
+    async def fake_run_cycle(
+        client: object,
+        config: smoke_runner.SmokeTestConfig,
+        *,
+        index: int,
+        scene_id: str,
+        step: str,
+        metrics: object,
+    ) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        seen.append((index, scene_id, step))
+        in_flight -= 1
+
+    monkeypatch.setattr(smoke_runner, "wait_for_service", fake_wait_for_service)
+    monkeypatch.setattr(smoke_runner, "_run_cycle", fake_run_cycle)
+
+    config = smoke_runner.SmokeTestConfig(
+        host="127.0.0.1",
+        port=0,
+        project_id=sample_project_root.name,
+        project_base_dir=sample_project_root.parent,
+        cycles=5,
+        timeout=1.0,
+        wizard_steps=("input_scope", "framing"),
+    )
+    asyncio.run(smoke_runner.run_cycles(config, concurrency=2))
+
+    assert peak == 2
+    assert sorted(seen) == [
+        (0, "sc_0001", "input_scope"),
+        (1, "sc_0002", "framing"),
+        (2, "sc_0001", "input_scope"),
+        (3, "sc_0002", "framing"),
+        (4, "sc_0001", "input_scope"),
+    ]
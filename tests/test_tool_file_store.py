@@ -111,3 +111,19 @@ def test_load_propagates_storage_errors(
 
     with pytest.raises(RuntimeError):
         tool.load(context, "project", "boom")
+
+
+def test_storage_save_replaces_record_atomically(temp_data_dir: Path) -> None:
+    first = storage.save({"kind": "project", "id": "atomic", "rev": 1}, base_dir=temp_data_dir)
+    second = storage.save({"kind": "project", "id": "atomic", "rev": 2}, base_dir=temp_data_dir)
+
+    assert first == second
+    assert storage.load("project", "atomic", base_dir=temp_data_dir)["rev"] == 2
+    assert [path.name for path in second.parent.iterdir()] == ["atomic.json"]
+
+
+def test_storage_load_does_not_create_directories(temp_data_dir: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        storage.load("draft", "missing", base_dir=temp_data_dir)
+
+    assert not (temp_data_dir / "drafts").exists()
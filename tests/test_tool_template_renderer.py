@@ -88,3 +88,14 @@ def test_render_generic_template_error(tool: TemplateRendererTool, temp_data_dir
     with pytest.raises(ValueError):
         tool.render(context, template_id, {"name": "Sky"})
     storage.path_for("template", template_id, base_dir=temp_data_dir).unlink(missing_ok=True)
+
+
+def test_render_picks_up_updated_template(tool: TemplateRendererTool, temp_data_dir: Path) -> None:
+    template_id = "revision"
+    _store_template(temp_data_dir, template_id, "Hi $name")
+    context = tool.context()
+    assert tool.render(context, template_id, {"name": "Sky"}).value == "Hi Sky"
+
+    _store_template(temp_data_dir, template_id, "Welcome back, $name")
+    assert tool.render(context, template_id, {"name": "Sky"}).value == "Welcome back, Sky"
+    storage.path_for("template", template_id, base_dir=temp_data_dir).unlink(missing_ok=True)